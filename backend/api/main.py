@@ -3,22 +3,28 @@ Synchronous FastAPI Backend for Research Assistant
 Direct request-response processing without background tasks
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
+from typing import Dict, Any, Optional, List, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from collections import deque
+from dataclasses import dataclass
+import asyncio
+import json
 import os
 from dotenv import load_dotenv
 import logging
-import uuid
+import time
 from datetime import datetime
+from statistics import fmean
 
 # Add the backend directory to the path
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from features.orchestration.research_crew import ResearchCrew
-
 # Load environment variables
 load_dotenv()
 
@@ -44,23 +50,148 @@ app.add_middleware(
 
 # Request/Response models
 class ResearchRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
     query: str
     config: Optional[Dict[str, Any]] = None
 
+class SourceModel(BaseModel):
+    """A source as reported by the crew; LLM-written fields are coerced rather than rejected"""
+    model_config = ConfigDict(extra='allow')
+
+    title: str = "Untitled Source"
+    url: str = ""
+    authors: List[str] = ["Unknown"]
+    date: Optional[str] = None
+    type: str = "web"
+    credibility_score: float = 7.5
+    relevance_score: float = 8.0
+    summary: str = ""
+    key_findings: List[Any] = []
+    bias_indicators: List[str] = []
+
+    @field_validator('title', 'url', 'type', 'summary', mode='before')
+    @classmethod
+    def _coerce_text(cls, value: Any, info: ValidationInfo) -> Any:
+        """Missing text takes the default; anything else is stringified"""
+        if value is None:
+            return cls.model_fields[info.field_name].get_default()
+        return value if isinstance(value, str) else str(value)
+
+    @field_validator('date', mode='before')
+    @classmethod
+    def _coerce_date(cls, value: Any) -> Any:
+        """Dates are passed through as text"""
+        return value if value is None or isinstance(value, str) else str(value)
+
+    @field_validator('credibility_score', 'relevance_score', mode='before')
+    @classmethod
+    def _coerce_score(cls, value: Any, info: ValidationInfo) -> Any:
+        """Scores that are missing or not numeric take the default"""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return cls.model_fields[info.field_name].get_default()
+
+    @field_validator('authors', 'key_findings', 'bias_indicators', mode='before')
+    @classmethod
+    def _coerce_list(cls, value: Any, info: ValidationInfo) -> Any:
+        """A missing list takes the default and a single value becomes a one-item list"""
+        if value is None:
+            return cls.model_fields[info.field_name].get_default()
+        if not isinstance(value, (list, tuple, set)):
+            value = [value]
+        if info.field_name == 'key_findings':
+            return list(value)
+        return [item if isinstance(item, str) else str(item) for item in value if item is not None]
+
+class MetadataModel(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    total_sources: int = 0
+    execution_time: float = 0.0
+    avg_credibility: float = 0.0
+    confidence: float = 0.0
+    research_date: Optional[str] = None
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    agents_used: Optional[int] = None
+    tasks_completed: Optional[int] = None
+    memory_stats: Optional[Dict[str, Any]] = None
+
 class ResearchResponse(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
     success: bool
     query: str
     report: Dict[str, Any]
-    sources: list
-    metadata: Dict[str, Any]
+    sources: List[SourceModel]
+    metadata: MetadataModel
     execution_time: float
     error: Optional[str] = None
 
-# Initialize research crew
-research_crew = ResearchCrew()
+@dataclass(slots=True)
+class ResearchRecord:
+    """Summary of a research request kept for /recent and /metrics"""
+    query: str
+    timestamp: str
+    execution_time: float
+    success: bool
+    error: Optional[str] = None
+    cached: bool = False
+
+# Redis shared by all server processes for cached research responses (optional).
+# Server-side only: request configs cannot point the crew at another cache
+RESEARCH_CACHE_URL = os.getenv("RESEARCH_CACHE_URL")
+
+@lru_cache(maxsize=32)
+def _get_crew(config_key: Optional[str] = None):
+    """
+    Build a research crew for a serialized config, reusing it for identical configs
+
+    The crew (and crewai with it) is imported on first use so the lightweight
+    endpoints don't pay for it at startup.
+    """
+    from features.orchestration.research_crew import ResearchCrew
+    return ResearchCrew(json.loads(config_key) if config_key else None, shared_cache_url=RESEARCH_CACHE_URL)
+
+# Thread pool for running blocking crew executions off the event loop
+executor = ThreadPoolExecutor(max_workers=int(os.getenv("API_WORKERS", "4")))
+
+# Responses with more sources than this are streamed instead of buffered
+STREAM_SOURCES_THRESHOLD = int(os.getenv("STREAM_SOURCES_THRESHOLD", "200"))
+STREAM_CHUNK_SIZE = 50
+
+def _stream_response(head: ResearchResponse, sources: List[Any]) -> Iterator[bytes]:
+    """
+    Serialize a response as JSON, validating and emitting the sources in chunks
+
+    Sources are only validated as they are sent, so the first bytes go out
+    before the whole list has been turned into models.
+    """
+    yield head.model_dump_json(exclude={'sources'}).encode()[:-1] + b',"sources":['
+    for start in range(0, len(sources), STREAM_CHUNK_SIZE):
+        chunk = b','.join(
+            SourceModel.model_validate(source).model_dump_json().encode()
+            for source in sources[start:start + STREAM_CHUNK_SIZE]
+        )
+        yield (b',' if start else b'') + chunk
+    yield b']}'
+
+# Store recent research for metrics (last 10 records)
+recent_research: "deque[ResearchRecord]" = deque(maxlen=10)
 
-# Store recent research for metrics
-recent_research = []
+def _record_research(query: str, execution_time: float, success: bool, error: Optional[str] = None,
+                     cached: bool = False) -> None:
+    """Add a research request to the recent history"""
+    recent_research.append(ResearchRecord(
+        query=query,
+        timestamp=datetime.now().isoformat(),
+        execution_time=execution_time,
+        success=success,
+        error=error,
+        cached=cached
+    ))
 
 @app.get("/")
 async def root():
@@ -90,12 +221,13 @@ async def health_check():
     }
 
 @app.post("/research/sync", response_model=ResearchResponse)
-async def execute_research_sync(request: ResearchRequest):
+async def execute_research_sync(request: ResearchRequest, background_tasks: BackgroundTasks):
     """
     Execute research synchronously and return complete results
     
     Args:
         request: Research request with query and optional config
+        background_tasks: Tasks run after the response is sent
         
     Returns:
         Complete research results
@@ -104,20 +236,21 @@ async def execute_research_sync(request: ResearchRequest):
     if not request.query.strip():
         raise HTTPException(status_code=400, detail="Query cannot be empty")
     
+    # Configure crew if needed
+    config_key = json.dumps(request.config, sort_keys=True) if request.config else None
+    
     logger.info(f"Starting synchronous research for: {request.query}")
-    start_time = datetime.now()
+    t0 = time.perf_counter()
     
     try:
-        # Configure crew if needed
-        if request.config:
-            crew = ResearchCrew(request.config)
-        else:
-            crew = research_crew
-        
-        # Execute research synchronously
-        result = crew.execute_research(request.query)
+        # Build the crew and execute research in the thread pool so the event loop stays free.
+        # Repeated queries are answered from the crew's response cache, which owns
+        # caching and invalidation (ResearchCrew.clear_query_cache)
+        loop = asyncio.get_running_loop()
+        crew = await loop.run_in_executor(executor, _get_crew, config_key)
+        result = await loop.run_in_executor(executor, crew.execute_research, request.query)
         
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - t0
         
         # Ensure result has all required fields
         if not result.get('success'):
@@ -126,43 +259,37 @@ async def execute_research_sync(request: ResearchRequest):
                 detail=f"Research failed: {result.get('error', 'Unknown error')}"
             )
         
-        # Add to recent research
-        research_record = {
-            "query": request.query,
-            "timestamp": datetime.now().isoformat(),
-            "execution_time": execution_time,
-            "success": result.get('success', False)
-        }
-        recent_research.append(research_record)
-        
-        # Keep only last 10 records
-        if len(recent_research) > 10:
-            recent_research.pop(0)
+        # Add to recent research once the response is sent
+        background_tasks.add_task(
+            _record_research, request.query, execution_time, result.get('success', False),
+            cached=result.get('cached', False)
+        )
         
         logger.info(f"Research completed successfully in {execution_time:.2f}s")
         
-        return ResearchResponse(
+        # Large payloads are streamed instead of buffered, validating sources as they go
+        sources = result['sources']
+        streamed = len(sources) > STREAM_SOURCES_THRESHOLD
+        
+        response = ResearchResponse(
             success=result['success'],
             query=result['query'],
             report=result['report'],
-            sources=result['sources'],
+            sources=[] if streamed else sources,
             metadata=result['metadata'],
             execution_time=result['execution_time']
         )
+        if streamed:
+            return StreamingResponse(_stream_response(response, sources), media_type="application/json")
+        
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - t0
         logger.error(f"Research failed: {str(e)}")
         
-        # Add failed research to records
-        research_record = {
-            "query": request.query,
-            "timestamp": datetime.now().isoformat(),
-            "execution_time": execution_time,
-            "success": False,
-            "error": str(e)
-        }
-        recent_research.append(research_record)
+        # Add failed research to records now; background tasks don't run for errors
+        _record_research(request.query, execution_time, False, str(e))
         
         raise HTTPException(
             status_code=500,
@@ -174,7 +301,7 @@ async def get_recent_research():
     """Get recent research history"""
     return {
         "count": len(recent_research),
-        "research": recent_research
+        "research": list(recent_research)
     }
 
 @app.get("/metrics")
@@ -187,15 +314,16 @@ async def get_metrics():
             "avg_execution_time": 0
         }
     
-    successful = [r for r in recent_research if r.get('success')]
+    successful = [r for r in recent_research if r.success]
     total = len(recent_research)
     
-    avg_time = sum(r.get('execution_time', 0) for r in recent_research) / total
+    avg_time = fmean(r.execution_time for r in recent_research)
     
     return {
         "total_research": total,
         "successful": len(successful),
         "failed": total - len(successful),
+        "cached": sum(r.cached for r in recent_research),
         "success_rate": (len(successful) / total) * 100,
         "avg_execution_time": round(avg_time, 2)
     }
@@ -206,15 +334,22 @@ if __name__ == "__main__":
     # Get configuration from environment
     host = os.getenv("API_HOST", "0.0.0.0")
     port = int(os.getenv("API_PORT", "8000"))
+    reload = os.getenv("API_RELOAD", "False").lower() == "true"
+    # One process by default: recent research, metrics, crews and their query
+    # caches and run locks live in process memory, so each extra process keeps
+    # its own copy (set RESEARCH_CACHE_URL to at least share cached responses)
+    processes = int(os.getenv("API_PROCESSES", "1"))
     
     print("🚀 Starting Synchronous Research Assistant API...")
     print(f"📡 Server will run on: http://{host}:{port}")
     print("📝 Endpoint: POST /research/sync")
     
-    # Run the server
+    # Run the server. Reload is for development only and runs a single
+    # process; uvloop/httptools are used when installed (uvicorn[standard]).
     uvicorn.run(
-        "main_sync:app",
+        "main:app",
         host=host,
         port=port,
-        reload=True
-    )
\ No newline at end of file
+        reload=reload,
+        workers=1 if reload else processes
+    )
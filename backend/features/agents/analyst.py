@@ -3,14 +3,54 @@ Data Analyst Agent
 Specializes in analyzing and processing collected information
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from statistics import fmean
+from urllib.parse import urlsplit
 from crewai import Agent
 from ..memory.research_memory import ResearchMemory
 from ..tools.tools_manager import get_tools_manager
 import logging
+import re
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Keywords used for simple trend detection
+_TREND_KEYWORDS: Tuple[str, ...] = ('increase', 'decrease', 'growth', 'decline', 'improvement', 'impact')
+_TREND_RE = re.compile('|'.join(_TREND_KEYWORDS))
+_TREND_INDEX = {keyword: j for j, keyword in enumerate(_TREND_KEYWORDS)}
+
+# Opposing terms used for contradiction detection
+_OPPOSING_PAIRS: Tuple[Tuple[str, str], ...] = (
+    ('increase', 'decrease'),
+    ('positive', 'negative'),
+    ('growth', 'decline'),
+    ('improvement', 'deterioration')
+)
+_OPPOSING_RE = re.compile('|'.join(term for pair in _OPPOSING_PAIRS for term in pair))
+
+# Hostname markers for source categories, checked in priority order
+_DOMAIN_CATEGORIES: Dict[str, str] = {'edu': 'academic', 'gov': 'government'}
+_NEWS_HOST_RE = re.compile('news|times|post')
+
+
+@lru_cache(maxsize=4096)
+def _categorize_url(url: str) -> str:
+    """Categorize a source URL by its hostname, caching repeated domains"""
+    try:
+        host = urlsplit(url if '//' in url else '//' + url).hostname or ''
+    except ValueError:
+        host = ''
+    labels = host.split('.')[1:]
+    for label, category in _DOMAIN_CATEGORIES.items():
+        if label in labels:
+            return category
+    if _NEWS_HOST_RE.search(host):
+        return 'news'
+    return 'other'
+
 
 class DataAnalystAgent:
     """Data Analyst - analyzes collected information and generates insights"""
@@ -27,6 +67,11 @@ class DataAnalystAgent:
         self.config = config or {}
         self.tools_manager = get_tools_manager()
         self.tools = self._get_tools()
+        self._event_handlers = {
+            'analysis_started': self._on_analysis_started,
+            'pattern_found': self._on_pattern_found,
+            'insight_generated': self._on_insight_generated,
+        }
         self.agent = self._create_agent()
         logger.info("Data Analyst agent initialized")
     
@@ -62,27 +107,35 @@ class DataAnalystAgent:
     def _agent_callback(self, event: Dict[str, Any]) -> None:
         """Callback for agent events"""
         event_type = event.get('type', 'unknown')
-        logger.debug(f"Analyst event: {event_type}")
-        
-        # Track analysis events
-        if event_type == 'analysis_started':
-            self.memory.store_short_term('analyst_current_task', event)
-        
-        if event_type == 'pattern_found':
-            pattern = event.get('pattern')
-            self.memory.store_long_term('identified_patterns', pattern, 'append')
-        
-        if event_type == 'insight_generated':
-            insight = event.get('insight')
-            self.memory.share_data(
-                'data_analyst',
-                {
-                    'type': 'insight',
-                    'content': insight,
-                    'confidence': event.get('confidence', 0.5)
-                },
-                priority='high'
-            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Analyst event: {event_type}")
+        
+        # Track analysis events; unhandled event types are ignored
+        handler = self._event_handlers.get(event_type)
+        if handler is not None:
+            handler(event)
+    
+    def _on_analysis_started(self, event: Dict[str, Any]) -> None:
+        """Record the task the analyst is working on"""
+        self.memory.store_short_term('analyst_current_task', event)
+    
+    def _on_pattern_found(self, event: Dict[str, Any]) -> None:
+        """Append an identified pattern to long-term memory"""
+        pattern = event.get('pattern')
+        self.memory.store_long_term('identified_patterns', pattern, 'append')
+    
+    def _on_insight_generated(self, event: Dict[str, Any]) -> None:
+        """Share a generated insight with the other agents"""
+        insight = event.get('insight')
+        self.memory.share_data(
+            'data_analyst',
+            {
+                'type': 'insight',
+                'content': insight,
+                'confidence': event.get('confidence', 0.5)
+            },
+            priority='high'
+        )
     
     def analyze_information(self, gathered_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -153,23 +206,26 @@ class DataAnalystAgent:
         """Identify patterns in the findings"""
         patterns = []
         
-        # Group findings by common themes (simplified)
-        theme_counts = {}
-        for finding in findings:
-            content = finding.get('finding', '').lower()
-            
-            # Simple keyword-based pattern detection
-            keywords = ['increase', 'decrease', 'growth', 'decline', 'improvement', 'impact']
-            for keyword in keywords:
-                if keyword in content:
-                    theme_counts[keyword] = theme_counts.get(keyword, 0) + 1
-        
-        # Convert to patterns
-        for theme, count in theme_counts.items():
+        if not findings:
+            return patterns
+        
+        # Group findings by common themes (simplified) using a keyword
+        # presence matrix: one row per finding, one column per keyword
+        presence = np.zeros((len(findings), len(_TREND_KEYWORDS)), dtype=np.uint8)
+        for i, finding in enumerate(findings):
+            for keyword in _TREND_RE.findall(finding.get('finding', '').lower()):
+                presence[i, _TREND_INDEX[keyword]] = 1
+        
+        counts = presence.sum(axis=0)
+        
+        # Convert to patterns, keeping themes in order of first appearance
+        first_seen = presence.argmax(axis=0)
+        for j in np.lexsort((np.arange(len(_TREND_KEYWORDS)), first_seen)):
+            count = int(counts[j])
             if count >= 2:  # Pattern threshold
                 patterns.append({
                     'type': 'trend',
-                    'theme': theme,
+                    'theme': _TREND_KEYWORDS[j],
                     'frequency': count,
                     'strength': 'strong' if count >= 3 else 'moderate'
                 })
@@ -223,7 +279,7 @@ class DataAnalystAgent:
         
         # Compare reliability across types
         for s_type, type_sources in source_types.items():
-            avg_reliability = sum(s.get('reliability', 0.5) for s in type_sources) / len(type_sources)
+            avg_reliability = fmean(s.get('reliability', 0.5) for s in type_sources)
             comparisons.append({
                 'source_type': s_type,
                 'count': len(type_sources),
@@ -235,43 +291,35 @@ class DataAnalystAgent:
     
     def _categorize_source(self, url: str) -> str:
         """Categorize source by URL"""
-        if '.edu' in url:
-            return 'academic'
-        elif '.gov' in url:
-            return 'government'
-        elif any(news in url for news in ['news', 'times', 'post']):
-            return 'news'
-        else:
-            return 'other'
+        return _categorize_url(url)
     
     def _find_contradictions(self, findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Identify contradictions in findings"""
         contradictions = []
         
-        # Simple contradiction detection based on opposing keywords
-        opposing_pairs = [
-            ('increase', 'decrease'),
-            ('positive', 'negative'),
-            ('growth', 'decline'),
-            ('improvement', 'deterioration')
-        ]
-        
-        for i, finding1 in enumerate(findings):
-            content1 = finding1.get('finding', '').lower()
-            
-            for j, finding2 in enumerate(findings[i+1:], i+1):
-                content2 = finding2.get('finding', '').lower()
-                
-                # Check for opposing terms
-                for term1, term2 in opposing_pairs:
-                    if (term1 in content1 and term2 in content2) or \
-                       (term2 in content1 and term1 in content2):
-                        contradictions.append({
-                            'type': 'opposing_claims',
-                            'source1': finding1.get('source', {}).get('title', 'Unknown'),
-                            'source2': finding2.get('source', {}).get('title', 'Unknown'),
-                            'conflict': f"{term1} vs {term2}"
-                        })
+        # Simple contradiction detection based on opposing keywords.
+        # Index which findings mention each term in a single pass.
+        presence = defaultdict(list)
+        for idx, finding in enumerate(findings):
+            for term in set(_OPPOSING_RE.findall(finding.get('finding', '').lower())):
+                presence[term].append(idx)
+        
+        # Only pair up findings that mention opposite sides of a pair
+        conflicts = set()
+        for p, (term1, term2) in enumerate(_OPPOSING_PAIRS):
+            for a in presence.get(term1, ()):
+                for b in presence.get(term2, ()):
+                    if a != b:
+                        conflicts.add((min(a, b), max(a, b), p))
+        
+        for i, j, p in sorted(conflicts):
+            term1, term2 = _OPPOSING_PAIRS[p]
+            contradictions.append({
+                'type': 'opposing_claims',
+                'source1': findings[i].get('source', {}).get('title', 'Unknown'),
+                'source2': findings[j].get('source', {}).get('title', 'Unknown'),
+                'conflict': f"{term1} vs {term2}"
+            })
         
         return contradictions
     
@@ -282,8 +330,12 @@ class DataAnalystAgent:
         
         # Source reliability confidence
         if sources:
-            avg_reliability = sum(s.get('reliability', 0.5) for s in sources) / len(sources)
-            confidence['source_reliability'] = avg_reliability
+            reliability = np.fromiter(
+                (s.get('reliability', 0.5) for s in sources),
+                dtype=np.float64,
+                count=len(sources)
+            )
+            confidence['source_reliability'] = float(reliability.mean())
         else:
             confidence['source_reliability'] = 0.0
         
@@ -313,9 +365,9 @@ class DataAnalystAgent:
         
         # Insight summary
         if insights:
-            high_conf_insights = [i for i in insights if i.get('confidence', 0) > 0.7]
-            if high_conf_insights:
-                summary_parts.append(f"{len(high_conf_insights)} high-confidence insights generated")
+            high_conf = sum(1 for i in insights if (i.get('confidence') or 0) > 0.7)
+            if high_conf:
+                summary_parts.append(f"{high_conf} high-confidence insights generated")
         
         # Confidence summary
         overall_conf = confidence.get('overall', 0)
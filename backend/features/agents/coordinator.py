@@ -3,13 +3,137 @@ Research Coordinator Agent
 Main orchestrator for the research assistant system
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union, Deque
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache, cached_property
 from crewai import Agent
 from ..memory.research_memory import ResearchMemory
+from ..utils.keywords import KeywordMatcher
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Task type and agent status vocabulary, interned for identity-fast comparisons
+TYPE_GATHER = sys.intern('information_gathering')
+TYPE_ANALYZE = sys.intern('analysis')
+TYPE_SYNTH = sys.intern('synthesis')
+STATUS_COMPLETED = sys.intern('completed')
+STATUS_ERROR = sys.intern('error')
+
+# Task types in execution order: gathering -> analysis -> synthesis
+_TASK_PHASES = (TYPE_GATHER, TYPE_ANALYZE, TYPE_SYNTH)
+
+# Agent events recorded in short-term memory
+_TRACKED_EVENTS = frozenset({'task_started', 'task_completed', 'delegation'})
+
+# Number of recent agent events kept in the event history
+_EVENT_HISTORY_SIZE = 256
+
+# Sub-task rules: objective trigger words, id suffix, task type, description, agent
+_SUB_TASK_RULES = (
+    (('information', 'identify'), 'gather', TYPE_GATHER,
+     "Gather relevant information for: {objective}", 'information_gatherer'),
+    (('analyze', 'compare'), 'analyze', TYPE_ANALYZE,
+     "Analyze data for: {objective}", 'data_analyst')
+)
+
+# Query keywords indicating high complexity
+_HIGH_COMPLEXITY_KEYWORDS = frozenset({
+    'comprehensive', 'detailed', 'in-depth', 'analyze',
+    'compare', 'evaluate', 'assess', 'investigate'
+})
+
+# Research objectives and the query keywords that trigger them, in order
+_OBJECTIVE_KEYWORDS = (
+    (('what',), "Identify and explain key concepts"),
+    (('how',), "Explain processes or mechanisms"),
+    (('why',), "Analyze causes and reasons"),
+    (('compare', 'difference'), "Compare and contrast different aspects"),
+    (('impact', 'effect'), "Analyze impacts and effects"),
+    (('future', 'trend'), "Identify future trends and projections"),
+    (('current', 'latest'), "Find current/latest information")
+)
+
+# Every keyword the planning heuristics look for, matched in one scan
+_QUERY_MATCHER = KeywordMatcher(
+    _HIGH_COMPLEXITY_KEYWORDS.union(kw for keywords, _ in _OBJECTIVE_KEYWORDS for kw in keywords)
+)
+
+
+@lru_cache(maxsize=1024)
+def _plan_core(query: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Derive a query's complexity and objectives from a single keyword scan
+    
+    Memoized per query; compiled along with this module when the optional
+    Cython build is used.
+    
+    Args:
+        query: Research query
+        
+    Returns:
+        Complexity level and research objectives
+    """
+    # Simple heuristic based on query characteristics
+    query_lower = query.lower()
+    matched = _QUERY_MATCHER.find(query_lower)
+    
+    # Check for multiple questions or topics
+    question_marks = query.count('?')
+    and_count = query_lower.count(' and ')
+    
+    # Add points for complexity indicators
+    complexity_score = len(matched & _HIGH_COMPLEXITY_KEYWORDS)
+    complexity_score += question_marks
+    complexity_score += and_count
+    
+    # Determine complexity level
+    if complexity_score >= 4:
+        complexity = 'high'
+    elif complexity_score >= 2:
+        complexity = 'medium'
+    else:
+        complexity = 'low'
+    
+    # Common research patterns
+    objectives = tuple(
+        objective for keywords, objective in _OBJECTIVE_KEYWORDS
+        if any(keyword in matched for keyword in keywords)
+    )
+    
+    # Default objective if none identified
+    return complexity, objectives or ("Gather comprehensive information on the topic",)
+
+
+@dataclass
+class SubTaskBatch:
+    """Sub-tasks of a plan stored as parallel columns, one list per field"""
+    ids: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    objectives: List[str] = field(default_factory=list)
+    agents: List[str] = field(default_factory=list)
+    
+    def append(self, task_id: str, task_type: str, description: str, objective: str, agent: str) -> None:
+        """Add a sub-task"""
+        self.ids.append(task_id)
+        self.types.append(task_type)
+        self.descriptions.append(description)
+        self.objectives.append(objective)
+        self.agents.append(agent)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize the sub-tasks as the plan's list of dicts"""
+        return [
+            {'id': i, 'type': t, 'description': d, 'objective': o, 'agent': a}
+            for i, t, d, o, a in zip(self.ids, self.types, self.descriptions, self.objectives, self.agents)
+        ]
+
 
 class ResearchCoordinatorAgent:
     """Research Coordinator - orchestrates the entire research workflow"""
@@ -24,9 +148,15 @@ class ResearchCoordinatorAgent:
         """
         self.memory = memory
         self.config = config or {}
-        self.agent = self._create_agent()
+        self._event_buffer: Deque[Dict[str, Any]] = deque(maxlen=_EVENT_HISTORY_SIZE)
+        self._sub_task_rules = self._load_sub_task_rules()
         logger.info("Research Coordinator agent initialized")
     
+    @cached_property
+    def agent(self) -> Agent:
+        """CrewAI agent, created on first use"""
+        return self._create_agent()
+    
     def _create_agent(self) -> Agent:
         """Create and configure the coordinator agent"""
         return Agent(
@@ -55,23 +185,33 @@ class ResearchCoordinatorAgent:
         event_type = event.get('type', 'unknown')
         logger.debug(f"Coordinator event: {event_type}")
         
+        # Buffer every event; the history is flushed with task completions
+        self._event_buffer.append(event)
+        
         # Store important events in memory
-        if event_type in ['task_started', 'task_completed', 'delegation']:
-            self.memory.store_short_term(f"coordinator_event_{event_type}", event)
+        if event_type not in _TRACKED_EVENTS:
+            return
+        ops = [('short_term', f"coordinator_event_{event_type}", event)]
         
         # Track delegations
         if event_type == 'delegation':
             delegated_to = event.get('delegated_to')
             task = event.get('task')
-            self.memory.share_data(
+            ops.append((
+                'shared',
                 'coordinator',
                 {
                     'action': 'delegated',
                     'to': delegated_to,
                     'task': task
                 },
-                priority='high'
-            )
+                'high'
+            ))
+        
+        if event_type == 'task_completed':
+            ops.append(('short_term', 'coordinator_event_history', list(self._event_buffer)))
+        
+        self.memory.batch_write(ops)
     
     def plan_research(self, query: str) -> Dict[str, Any]:
         """
@@ -107,8 +247,8 @@ class ResearchCoordinatorAgent:
         plan['objectives'] = objectives
         
         # Break down into sub-tasks
-        sub_tasks = self._create_sub_tasks(objectives)
-        plan['sub_tasks'] = sub_tasks
+        sub_tasks = self._create_sub_task_batch(objectives)
+        plan['sub_tasks'] = sub_tasks.to_dicts()
         
         # Determine required agents
         required_agents = self._identify_required_agents(sub_tasks)
@@ -119,171 +259,144 @@ class ResearchCoordinatorAgent:
         plan['priority_order'] = priority_order
         
         # Store plan in memory
-        self.memory.store_short_term('research_plan', plan)
-        self.memory.share_data('coordinator', plan, priority='high')
+        self.memory.batch_write([
+            ('short_term', 'research_plan', plan),
+            ('shared', 'coordinator', plan, 'high')
+        ])
         
         logger.info(f"Research plan created with {len(sub_tasks)} sub-tasks")
         return plan
     
     def _analyze_complexity(self, query: str) -> str:
         """Analyze query complexity"""
-        # Simple heuristic based on query characteristics
-        query_lower = query.lower()
-        
-        # High complexity indicators
-        high_complexity_keywords = [
-            'comprehensive', 'detailed', 'in-depth', 'analyze', 
-            'compare', 'evaluate', 'assess', 'investigate'
-        ]
-        
-        # Check for multiple questions or topics
-        question_marks = query.count('?')
-        and_count = query_lower.count(' and ')
-        
-        complexity_score = 0
-        
-        # Add points for complexity indicators
-        for keyword in high_complexity_keywords:
-            if keyword in query_lower:
-                complexity_score += 1
-        
-        complexity_score += question_marks
-        complexity_score += and_count
-        
-        # Determine complexity level
-        if complexity_score >= 4:
-            return 'high'
-        elif complexity_score >= 2:
-            return 'medium'
-        else:
-            return 'low'
+        return _plan_core(query)[0]
     
     def _identify_objectives(self, query: str) -> List[str]:
         """Identify key objectives from the query"""
-        objectives = []
-        
-        # Extract main research goals
-        query_lower = query.lower()
-        
-        # Common research patterns
-        if 'what' in query_lower:
-            objectives.append("Identify and explain key concepts")
-        if 'how' in query_lower:
-            objectives.append("Explain processes or mechanisms")
-        if 'why' in query_lower:
-            objectives.append("Analyze causes and reasons")
-        if 'compare' in query_lower or 'difference' in query_lower:
-            objectives.append("Compare and contrast different aspects")
-        if 'impact' in query_lower or 'effect' in query_lower:
-            objectives.append("Analyze impacts and effects")
-        if 'future' in query_lower or 'trend' in query_lower:
-            objectives.append("Identify future trends and projections")
-        if 'current' in query_lower or 'latest' in query_lower:
-            objectives.append("Find current/latest information")
-        
-        # Default objective if none identified
-        if not objectives:
-            objectives.append("Gather comprehensive information on the topic")
+        return list(_plan_core(query)[1])
+    
+    def get_research_objectives(self, query: str) -> Tuple[str, ...]:
+        """
+        Get the research objectives planned for a query
         
-        return objectives
+        Args:
+            query: Research query
+            
+        Returns:
+            Objectives in plan order (memoized, hence immutable)
+        """
+        return _plan_core(query)[1]
+    
+    def clear_cache(self) -> None:
+        """Clear the memoized planning heuristics"""
+        _plan_core.cache_clear()
+    
+    def _load_sub_task_rules(self) -> Tuple[Tuple, ...]:
+        """Sub-task rules from the 'sub_task_rules' config, or the defaults"""
+        rules = self.config.get('sub_task_rules')
+        if not rules:
+            return _SUB_TASK_RULES
+        
+        return tuple(
+            (
+                tuple(rule['triggers']),
+                rule['id_suffix'],
+                sys.intern(rule['type']),
+                rule['description'],
+                rule['agent']
+            )
+            for rule in rules
+        )
     
     def _create_sub_tasks(self, objectives: List[str]) -> List[Dict[str, Any]]:
         """Create sub-tasks based on objectives"""
-        sub_tasks = []
+        return self._create_sub_task_batch(objectives).to_dicts()
+    
+    def _create_sub_task_batch(self, objectives: List[str]) -> SubTaskBatch:
+        """Create sub-tasks based on objectives as a columnar batch"""
+        batch = SubTaskBatch()
         
         for i, objective in enumerate(objectives):
-            # Information gathering task
-            if "information" in objective.lower() or "identify" in objective.lower():
-                sub_tasks.append({
-                    'id': f'task_{i}_gather',
-                    'type': 'information_gathering',
-                    'description': f"Gather relevant information for: {objective}",
-                    'objective': objective,
-                    'agent': 'information_gatherer'
-                })
+            objective_lower = objective.lower()
             
-            # Analysis task
-            if "analyze" in objective.lower() or "compare" in objective.lower():
-                sub_tasks.append({
-                    'id': f'task_{i}_analyze',
-                    'type': 'analysis',
-                    'description': f"Analyze data for: {objective}",
-                    'objective': objective,
-                    'agent': 'data_analyst'
-                })
+            # Gathering and analysis tasks triggered by the objective's wording
+            for triggers, suffix, task_type, description, agent in self._sub_task_rules:
+                if any(trigger in objective_lower for trigger in triggers):
+                    batch.append(
+                        f'task_{i}_{suffix}',
+                        task_type,
+                        description.format(objective=objective),
+                        objective,
+                        agent
+                    )
             
             # Synthesis task (always needed for final output)
             if i == len(objectives) - 1:  # Last objective
-                sub_tasks.append({
-                    'id': f'task_{i}_synthesize',
-                    'type': 'synthesis',
-                    'description': "Synthesize all findings into comprehensive report",
-                    'objective': "Create final research output",
-                    'agent': 'content_synthesizer'
-                })
-        
-        return sub_tasks
+                batch.append(
+                    f'task_{i}_synthesize',
+                    TYPE_SYNTH,
+                    "Synthesize all findings into comprehensive report",
+                    "Create final research output",
+                    'content_synthesizer'
+                )
+        
+        return batch
     
-    def _identify_required_agents(self, sub_tasks: List[Dict[str, Any]]) -> List[str]:
-        """Identify which agents are needed"""
-        required_agents = set()
-        
-        for task in sub_tasks:
-            agent = task.get('agent')
-            if agent:
-                required_agents.add(agent)
-        
-        return list(required_agents)
+    def _identify_required_agents(self, sub_tasks: Union[SubTaskBatch, List[Dict[str, Any]]]) -> List[str]:
+        """Identify which agents are needed, in order of first use"""
+        if isinstance(sub_tasks, SubTaskBatch):
+            agents = sub_tasks.agents
+        else:
+            agents = (task.get('agent') for task in sub_tasks)
+        return list(dict.fromkeys(agent for agent in agents if agent))
     
-    def _prioritize_tasks(self, sub_tasks: List[Dict[str, Any]]) -> List[str]:
+    def _prioritize_tasks(self, sub_tasks: Union[SubTaskBatch, List[Dict[str, Any]]]) -> List[str]:
         """Determine task execution order"""
-        # Simple priority: gathering -> analysis -> synthesis
-        priority_order = []
-        
-        # First: all gathering tasks
-        for task in sub_tasks:
-            if task['type'] == 'information_gathering':
-                priority_order.append(task['id'])
+        if isinstance(sub_tasks, SubTaskBatch):
+            typed_ids = zip(sub_tasks.types, sub_tasks.ids)
+        else:
+            typed_ids = ((task['type'], task['id']) for task in sub_tasks)
         
-        # Second: all analysis tasks
-        for task in sub_tasks:
-            if task['type'] == 'analysis':
-                priority_order.append(task['id'])
+        # Simple priority: gathering -> analysis -> synthesis
+        buckets = {phase: [] for phase in _TASK_PHASES}
         
-        # Last: synthesis tasks
-        for task in sub_tasks:
-            if task['type'] == 'synthesis':
-                priority_order.append(task['id'])
+        for task_type, task_id in typed_ids:
+            bucket = buckets.get(task_type)
+            if bucket is not None:
+                bucket.append(task_id)
         
-        return priority_order
+        return [task_id for phase in _TASK_PHASES for task_id in buckets[phase]]
     
     def monitor_progress(self) -> Dict[str, Any]:
         """Monitor research progress"""
         # Get shared data from all agents
         all_shared_data = self.memory.get_all_shared_data()
         
+        # Check each agent's status in a single walk
+        agent_status, completed, errors = {}, [], []
+        for agent_id, data in all_shared_data.items():
+            if not isinstance(data, dict):
+                continue
+            
+            status = data.get('status', 'unknown')
+            agent_status[agent_id] = status
+            
+            if status == STATUS_COMPLETED:
+                completed.append(agent_id)
+            elif status == STATUS_ERROR:
+                errors.append({
+                    'agent': agent_id,
+                    'error': data.get('error', 'Unknown error')
+                })
+        
         progress = {
             'total_agents': len(all_shared_data),
-            'agent_status': {},
-            'completed_tasks': [],
+            'agent_status': agent_status,
+            'completed_tasks': completed,
             'pending_tasks': [],
-            'errors': []
+            'errors': errors
         }
         
-        # Check each agent's status
-        for agent_id, data in all_shared_data.items():
-            if isinstance(data, dict):
-                status = data.get('status', 'unknown')
-                progress['agent_status'][agent_id] = status
-                
-                if status == 'completed':
-                    progress['completed_tasks'].append(agent_id)
-                elif status == 'error':
-                    progress['errors'].append({
-                        'agent': agent_id,
-                        'error': data.get('error', 'Unknown error')
-                    })
-        
         return progress
     
     def get_agent(self) -> Agent:
@@ -3,14 +3,143 @@ Information Gatherer Agent
 Specializes in collecting and retrieving information from various sources
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Callable, Pattern, Deque
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, cached_property
 from crewai import Agent
 from ..memory.research_memory import ResearchMemory
 from ..tools.tools_manager import get_tools_manager
+from ..utils.keywords import KeywordMatcher
+import datetime
 import logging
+import numpy as np
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
+# Source types and the query keywords that call for them, in order
+_SOURCE_TYPE_KEYWORDS = (
+    (('research', 'study'), 'academic'),
+    (('news', 'current', 'latest'), 'news'),
+    (('how to', 'guide'), 'tutorial')
+)
+_SOURCE_TYPE_MATCHER = KeywordMatcher(kw for keywords, _ in _SOURCE_TYPE_KEYWORDS for kw in keywords)
+
+# News outlets that earn a reliability bonus
+_TRUSTED_NEWS_DOMAINS = frozenset({'reuters', 'bbc', 'nytimes'})
+
+# Domain markers used for reliability, classified in one scan of the URL
+_RELIABLE_DOMAINS = frozenset({'.edu', '.gov'})
+_DOMAIN_MATCHER = KeywordMatcher(_RELIABLE_DOMAINS | _TRUSTED_NEWS_DOMAINS | {'.org'})
+
+# Recency score by source age in years; anything older scores 0.3
+_YEAR_RE = re.compile(r'20\d{2}')
+_RECENCY_BY_AGE = (1.0, 0.9, 0.7, 0.5)
+
+# Events that report gatherer progress, and how many recent events to keep
+_PROGRESS_EVENTS = frozenset({'search_completed', 'extraction_completed'})
+_EVENT_HISTORY_SIZE = 256
+
+# Words in source content that mark a finding
+_FINDING_RE = re.compile('found|discovered|revealed', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _year_for_hour(hour: int) -> int:
+    """Read the current year once per hour bucket"""
+    return datetime.datetime.now().year
+
+
+def _current_year() -> int:
+    """Current year, refreshed at most once an hour"""
+    return _year_for_hour(int(time.time()) // 3600)
+
+
+@lru_cache(maxsize=4)
+def _recent_query_re(current_year: int) -> Pattern:
+    """Pattern matching queries that already ask for recent results"""
+    return re.compile(f'recent|latest|{current_year}|{current_year - 1}')
+
+
+@lru_cache(maxsize=1024)
+def _search_queries_for(query: str, current_year: int) -> Tuple[str, ...]:
+    """Create variations of a search query, memoized per query and year"""
+    queries = [query]  # Original query
+    query_lower = query.lower()
+    
+    # Add quoted version for exact match
+    if '"' not in query:
+        queries.append(f'"{query}"')
+    
+    # Add academic version
+    if 'research' not in query_lower:
+        queries.append(f"{query} research study")
+    
+    # Add recent version - use current year
+    if not _recent_query_re(current_year).search(query_lower):
+        queries.append(f"{query} {current_year-1}")  # Use previous year for more results
+    
+    return tuple(queries[:3])  # Limit to 3 queries
+
+
+@lru_cache(maxsize=1024)
+def _fallback_queries_for(query: str) -> Tuple[str, ...]:
+    """Create fallback queries by keeping the likely key words of a query"""
+    # Simplify query by removing adjectives and keeping key nouns
+    # Simple heuristic: keep words that are likely nouns (capitalized or long)
+    key_words = (w for w in query.split() if len(w) > 4 or w[0].isupper())
+    
+    # Need at least two key words; stop scanning early otherwise
+    first = next(key_words, None)
+    second = next(key_words, None)
+    if second is None:
+        return ()
+    
+    return (' '.join((first, second, *key_words)),)
+
+
+@lru_cache(maxsize=4096)
+def _reliability_score(url: str, source_type: str, has_author: bool, has_date: bool) -> float:
+    """Calculate a reliability score from a source's URL, type and attribution"""
+    score = 0.5  # Base score
+    
+    # Domain-based scoring
+    domains = _DOMAIN_MATCHER.find(url)
+    if not domains.isdisjoint(_RELIABLE_DOMAINS):
+        score += 0.3
+    elif '.org' in domains:
+        score += 0.1
+    
+    # Source type scoring
+    source_type = source_type.lower()
+    if 'academic' in source_type:
+        score += 0.2
+    elif 'news' in source_type and not domains.isdisjoint(_TRUSTED_NEWS_DOMAINS):
+        score += 0.1
+    
+    # Has author
+    if has_author:
+        score += 0.1
+    
+    # Has date
+    if has_date:
+        score += 0.1
+    
+    return min(score, 1.0)
+
+
+@lru_cache(maxsize=1024)
+def _recency_score(date_str: str, current_year: int) -> float:
+    """Calculate a recency score from the most recent year in a date string"""
+    years = _YEAR_RE.findall(date_str)
+    if not years:
+        return 0.3
+    
+    age = max(current_year - int(max(years)), 0)
+    return _RECENCY_BY_AGE[age] if age < len(_RECENCY_BY_AGE) else 0.3
+
 
 class InformationGathererAgent:
     """Information Gatherer - collects data from multiple sources"""
@@ -25,11 +154,21 @@ class InformationGathererAgent:
         """
         self.memory = memory
         self.config = config or {}
+        self._score_pool: Optional[ThreadPoolExecutor] = None
+        self._event_buffer: Deque[Dict[str, Any]] = deque(maxlen=_EVENT_HISTORY_SIZE)
         self.tools_manager = get_tools_manager()
-        self.tools = self._get_tools()
-        self.agent = self._create_agent()
         logger.info("Information Gatherer agent initialized")
     
+    @cached_property
+    def tools(self) -> List[Any]:
+        """Tools for information gathering, loaded on first use"""
+        return self._get_tools()
+    
+    @cached_property
+    def agent(self) -> Agent:
+        """CrewAI agent, created on first use"""
+        return self._create_agent()
+    
     def _get_tools(self) -> List[Any]:
         """Get tools for information gathering"""
         tools = self.tools_manager.get_tools_for_agent('information_gatherer')
@@ -64,6 +203,9 @@ class InformationGathererAgent:
         event_type = event.get('type', 'unknown')
         logger.debug(f"Gatherer event: {event_type}")
         
+        # Buffer every event; the history is flushed with progress updates
+        self._event_buffer.append(event)
+        
         # Track important events
         if event_type == 'tool_use':
             tool_name = event.get('tool')
@@ -75,16 +217,16 @@ class InformationGathererAgent:
             if self._is_reliable_source(source):
                 self.memory.store_long_term('reliable_sources', source, 'append')
         
-        # Share progress
-        if event_type in ['search_completed', 'extraction_completed']:
-            self.memory.share_data(
-                'information_gatherer',
-                {
+        # Share progress, flushing the buffered event history with it
+        if event_type in _PROGRESS_EVENTS:
+            self.memory.batch_write([
+                ('shared', 'information_gatherer', {
                     'status': 'in_progress',
                     'last_action': event_type,
                     'timestamp': event.get('timestamp')
-                }
-            )
+                }),
+                ('short_term', 'gatherer_event_history', list(self._event_buffer))
+            ])
     
     def _is_reliable_source(self, source: Dict[str, Any]) -> bool:
         """Check if a source is reliable"""
@@ -92,16 +234,13 @@ class InformationGathererAgent:
             return False
         
         # Simple heuristic for reliability
-        reliability_indicators = [
-            '.edu' in source.get('url', ''),
-            '.gov' in source.get('url', ''),
-            'peer-reviewed' in source.get('description', '').lower(),
-            'academic' in source.get('type', '').lower(),
-            source.get('credibility_score', 0) > 0.7
-        ]
-        
         # More lenient: require at least 1 strong indicator
-        return sum(reliability_indicators) >= 1
+        return (
+            not _DOMAIN_MATCHER.find(source.get('url', '')).isdisjoint(_RELIABLE_DOMAINS)
+            or 'peer-reviewed' in source.get('description', '').lower()
+            or 'academic' in source.get('type', '').lower()
+            or source.get('credibility_score', 0) > 0.7
+        )
     
     def search_information(self, query: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -116,24 +255,19 @@ class InformationGathererAgent:
         """
         logger.info(f"Searching information for: {query}")
         
-        # Store query in memory
-        self.memory.store_short_term('current_search_query', query)
-        
         # Prepare search strategy
         search_strategy = self._prepare_search_strategy(query, context)
         
-        # Store strategy in memory
-        self.memory.store_short_term('search_strategy', search_strategy)
-        
-        # Share status
-        self.memory.share_data(
-            'information_gatherer',
-            {
+        # Store query and strategy in memory and share status
+        self.memory.batch_write([
+            ('short_term', 'current_search_query', query),
+            ('short_term', 'search_strategy', search_strategy),
+            ('shared', 'information_gatherer', {
                 'status': 'searching',
                 'query': query,
                 'strategy': search_strategy
-            }
-        )
+            })
+        ])
         
         return {
             'query': query,
@@ -162,12 +296,10 @@ class InformationGathererAgent:
                 strategy['depth'] = 'quick'
         
         # Determine source types needed
-        if 'research' in query_lower or 'study' in query_lower:
-            strategy['source_types'].append('academic')
-        if 'news' in query_lower or 'current' in query_lower or 'latest' in query_lower:
-            strategy['source_types'].append('news')
-        if 'how to' in query_lower or 'guide' in query_lower:
-            strategy['source_types'].append('tutorial')
+        matched = _SOURCE_TYPE_MATCHER.find(query_lower)
+        for keywords, source_type in _SOURCE_TYPE_KEYWORDS:
+            if any(keyword in matched for keyword in keywords):
+                strategy['source_types'].append(source_type)
         
         # Default to general if no specific type
         if not strategy['source_types']:
@@ -181,36 +313,11 @@ class InformationGathererAgent:
     
     def _create_search_queries(self, query: str) -> List[str]:
         """Create variations of search queries"""
-        queries = [query]  # Original query
-        
-        # Add quoted version for exact match
-        if '"' not in query:
-            queries.append(f'"{query}"')
-        
-        # Add academic version
-        if 'research' not in query.lower():
-            queries.append(f"{query} research study")
-        
-        # Add recent version - use current year
-        import datetime
-        current_year = datetime.datetime.now().year
-        if not any(word in query.lower() for word in ['recent', 'latest', str(current_year), str(current_year-1)]):
-            queries.append(f"{query} {current_year-1}")  # Use previous year for more results
-        
-        return queries[:3]  # Limit to 3 queries
+        return list(_search_queries_for(query, _current_year()))
     
     def _create_fallback_queries(self, query: str) -> List[str]:
         """Create fallback queries if primary searches fail"""
-        # Simplify query by removing adjectives and keeping key nouns
-        words = query.split()
-        
-        # Simple heuristic: keep words that are likely nouns (capitalized or long)
-        key_words = [w for w in words if len(w) > 4 or w[0].isupper()]
-        
-        if len(key_words) >= 2:
-            return [' '.join(key_words)]
-        
-        return []
+        return list(_fallback_queries_for(query))
     
     def evaluate_sources(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -222,28 +329,31 @@ class InformationGathererAgent:
         Returns:
             Evaluated and ranked sources
         """
-        evaluated_sources = []
+        n = len(sources)
+        reliability = np.fromiter(
+            self._score_sources(self._calculate_reliability_score, sources), dtype=np.float64, count=n
+        )
+        relevance = [s.get('relevance_score', 0.5) for s in sources]
+        recency = np.fromiter(
+            self._score_sources(self._calculate_recency_score, sources), dtype=np.float64, count=n
+        )
         
-        for source in sources:
-            evaluation = {
-                'source': source,
-                'reliability_score': self._calculate_reliability_score(source),
-                'relevance_score': source.get('relevance_score', 0.5),
-                'recency_score': self._calculate_recency_score(source),
-                'overall_score': 0.0
-            }
-            
-            # Calculate overall score
-            evaluation['overall_score'] = (
-                evaluation['reliability_score'] * 0.4 +
-                evaluation['relevance_score'] * 0.4 +
-                evaluation['recency_score'] * 0.2
-            )
-            
-            evaluated_sources.append(evaluation)
+        # Calculate overall scores in one pass
+        overall = reliability * 0.4 + np.asarray(relevance, dtype=np.float64) * 0.4 + recency * 0.2
         
-        # Sort by overall score
-        evaluated_sources.sort(key=lambda x: x['overall_score'], reverse=True)
+        # Sort by overall score (stable, so ties keep their input order)
+        order = np.argsort(-overall, kind='stable').tolist()
+        reliability, recency, overall = reliability.tolist(), recency.tolist(), overall.tolist()
+        evaluated_sources = [
+            {
+                'source': sources[i],
+                'reliability_score': reliability[i],
+                'relevance_score': relevance[i],
+                'recency_score': recency[i],
+                'overall_score': overall[i]
+            }
+            for i in order
+        ]
         
         # Store top sources in memory
         top_sources = [e['source'] for e in evaluated_sources[:5]]
@@ -251,52 +361,41 @@ class InformationGathererAgent:
         
         return evaluated_sources
     
+    def _score_sources(self, score: Callable[[Dict[str, Any]], float], sources: List[Dict[str, Any]]):
+        """Apply a per-source score, in a thread pool when 'parallel_scoring' is enabled"""
+        if not self.config.get('parallel_scoring') or len(sources) < 2:
+            return map(score, sources)
+        
+        if self._score_pool is None:
+            self._score_pool = ThreadPoolExecutor(
+                max_workers=self.config.get('max_workers'),
+                thread_name_prefix='source-scoring'
+            )
+        return self._score_pool.map(score, sources)
+    
+    def close(self) -> None:
+        """Shut down the source scoring thread pool, if one was started"""
+        if self._score_pool is not None:
+            self._score_pool.shutdown()
+            self._score_pool = None
+    
     def _calculate_reliability_score(self, source: Dict[str, Any]) -> float:
         """Calculate reliability score for a source"""
-        score = 0.5  # Base score
-        
-        url = source.get('url', '')
-        
-        # Domain-based scoring
-        if '.edu' in url:
-            score += 0.3
-        elif '.gov' in url:
-            score += 0.3
-        elif '.org' in url:
-            score += 0.1
-        
-        # Source type scoring
-        source_type = source.get('type', '').lower()
-        if 'academic' in source_type:
-            score += 0.2
-        elif 'news' in source_type and any(domain in url for domain in ['reuters', 'bbc', 'nytimes']):
-            score += 0.1
-        
-        # Has author
-        if source.get('author'):
-            score += 0.1
-        
-        # Has date
-        if source.get('date'):
-            score += 0.1
-        
-        return min(score, 1.0)
+        return _reliability_score(
+            source.get('url', ''),
+            source.get('type', ''),
+            bool(source.get('author')),
+            bool(source.get('date'))
+        )
     
     def _calculate_recency_score(self, source: Dict[str, Any]) -> float:
         """Calculate recency score for a source"""
-        # Simple implementation - in production would parse dates
-        date_str = source.get('date', '')
-        
-        if '2025' in date_str:
-            return 1.0
-        elif '2024' in date_str:
-            return 0.9
-        elif '2023' in date_str:
-            return 0.7
-        elif '2022' in date_str:
-            return 0.5
-        else:
-            return 0.3
+        return _recency_score(source.get('date', ''), _current_year())
+    
+    def clear_cache(self) -> None:
+        """Clear the memoized query and scoring heuristics"""
+        for cached in (_search_queries_for, _fallback_queries_for, _reliability_score, _recency_score):
+            cached.cache_clear()
     
     def extract_key_information(self, sources: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -332,24 +431,21 @@ class InformationGathererAgent:
                 extracted_info['sources_used'].append(source_ref)
                 
                 # Simple extraction based on keywords
-                if any(word in content.lower() for word in ['found', 'discovered', 'revealed']):
+                if _FINDING_RE.search(content):
                     extracted_info['main_findings'].append({
                         'finding': content[:200] + '...',
                         'source': source_ref
                     })
         
-        # Store in memory
-        self.memory.store_short_term('extracted_information', extracted_info)
-        
-        # Share completion status
-        self.memory.share_data(
-            'information_gatherer',
-            {
+        # Store in memory and share completion status
+        self.memory.batch_write([
+            ('short_term', 'extracted_information', extracted_info),
+            ('shared', 'information_gatherer', {
                 'status': 'completed',
                 'sources_found': len(sources),
                 'findings_extracted': len(extracted_info['main_findings'])
-            }
-        )
+            })
+        ])
         
         return extracted_info
     
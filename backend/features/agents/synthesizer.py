@@ -3,15 +3,111 @@ Content Synthesizer Agent
 Specializes in creating comprehensive research reports
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Tuple, Deque, Iterable, FrozenSet
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from crewai import Agent
 from ..memory.research_memory import ResearchMemory
 from ..tools.tools_manager import get_tools_manager
 from datetime import datetime
+import hashlib
+import json
 import logging
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
+# Words kept upper-case in report titles
+_ACRONYMS = frozenset(['AI', 'ML', 'NLP', 'API', 'URL', 'PDF', 'CSV'])
+
+# Source URLs on academic or government domains
+_URL_KIND_RE = re.compile(r'\.(edu|gov)(?:[/:.]|$)')
+_URL_KINDS: Dict[str, str] = {'edu': 'academic', 'gov': 'government'}
+
+# Number of recent agent events kept in the event history
+_EVENT_HISTORY_SIZE = 256
+
+# Report sections in order, with the empty value used when a section is not built
+_REPORT_SECTIONS: Dict[str, Callable[[], Any]] = {
+    'executive_summary': str,
+    'introduction': str,
+    'methodology': str,
+    'findings': list,
+    'analysis': dict,
+    'conclusions': list,
+    'recommendations': list,
+    'references': list,
+}
+
+# Sections read by create_summary
+SUMMARY_SECTIONS = frozenset({'executive_summary', 'conclusions', 'recommendations'})
+
+
+def _count_words(value: Any) -> int:
+    """Count the words in a report field: a string, or a list of strings and flat dicts"""
+    if isinstance(value, str):
+        return len(value.split())
+    
+    total = 0
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, str):
+                total += len(item.split())
+            elif isinstance(item, dict):
+                total += sum(len(v.split()) for v in item.values() if isinstance(v, str))
+    return total
+
+
+@dataclass(frozen=True)
+class _AnalysisBuckets:
+    """Insights and patterns filtered once for the sections that summarize them"""
+    confidences: Tuple[float, ...]
+    high_conf_count: int
+    strong_patterns: Tuple[Dict[str, Any], ...]
+
+
+def _bucket_analysis(analysis_results: Dict[str, Any]) -> _AnalysisBuckets:
+    """Project insight confidences and collect strong patterns in one pass each"""
+    confidences = tuple(i.get('confidence', 0) for i in analysis_results.get('insights', []))
+    return _AnalysisBuckets(
+        confidences=confidences,
+        high_conf_count=sum(1 for c in confidences if c > 0.7),
+        strong_patterns=tuple(p for p in analysis_results.get('patterns', []) if p.get('strength') == 'strong')
+    )
+
+
+@lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    """Format a wall-clock second once, however many timestamps fall within it"""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, at one-second resolution"""
+    return _iso_for_second(int(time.time()))
+
+
+def _report_cache_key(query: str,
+                      gathered_info: Dict[str, Any],
+                      analysis_results: Dict[str, Any],
+                      sections: Optional[FrozenSet[str]] = None) -> Optional[str]:
+    """Hash the canonical JSON form of the synthesis inputs, or None if they cannot be serialized"""
+    wanted = sorted(sections) if sections is not None else None
+    try:
+        payload = json.dumps([query, gathered_info, analysis_results, wanted], sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _build_section(build: Callable[..., Any], args: tuple) -> Tuple[Any, int]:
+    """Build one report section and count its words while it is still at hand"""
+    section = build(*args)
+    return section, _count_words(section)
+
 
 class ContentSynthesizerAgent:
     """Content Synthesizer - creates final research reports and summaries"""
@@ -26,11 +122,22 @@ class ContentSynthesizerAgent:
         """
         self.memory = memory
         self.config = config or {}
+        self._section_pool: Optional[ThreadPoolExecutor] = None
+        self._report_cache: OrderedDict[str, Tuple[Dict[str, Any], int]] = OrderedDict()
+        self._event_buffer: Deque[Dict[str, Any]] = deque(maxlen=_EVENT_HISTORY_SIZE)
         self.tools_manager = get_tools_manager()
-        self.tools = self._get_tools()
-        self.agent = self._create_agent()
         logger.info("Content Synthesizer agent initialized")
     
+    @cached_property
+    def tools(self) -> List[Any]:
+        """Tools for content synthesis, loaded on first use"""
+        return self._get_tools()
+    
+    @cached_property
+    def agent(self) -> Agent:
+        """CrewAI agent, created on first use"""
+        return self._create_agent()
+    
     def _get_tools(self) -> List[Any]:
         """Get tools for content synthesis"""
         tools = self.tools_manager.get_tools_for_agent('content_synthesizer')
@@ -63,30 +170,34 @@ class ContentSynthesizerAgent:
     def _agent_callback(self, event: Dict[str, Any]) -> None:
         """Callback for agent events"""
         event_type = event.get('type', 'unknown')
-        logger.debug(f"Synthesizer event: {event_type}")
+        logger.debug("Synthesizer event: %s", event_type)
+        
+        # Buffer every event; the history is flushed when the report completes
+        self._event_buffer.append(event)
         
         # Track synthesis events
         if event_type == 'synthesis_started':
             self.memory.store_short_term('synthesizer_current_task', event)
         
-        if event_type == 'section_completed':
+        elif event_type == 'section_completed':
             section = event.get('section')
             self.memory.store_short_term(f'completed_section_{section}', event)
         
-        if event_type == 'report_completed':
-            self.memory.share_data(
-                'content_synthesizer',
-                {
+        elif event_type == 'report_completed':
+            self.memory.batch_write([
+                ('shared', 'content_synthesizer', {
                     'status': 'completed',
                     'report_type': event.get('report_type', 'research'),
-                    'timestamp': datetime.now().isoformat()
-                }
-            )
+                    'timestamp': _now_iso()
+                }),
+                ('short_term', 'synthesizer_event_history', list(self._event_buffer))
+            ])
     
     def synthesize_report(self, 
                          query: str,
                          gathered_info: Dict[str, Any],
-                         analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+                         analysis_results: Dict[str, Any],
+                         sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Synthesize a comprehensive research report
         
@@ -94,12 +205,22 @@ class ContentSynthesizerAgent:
             query: Original research query
             gathered_info: Information from gatherer agent
             analysis_results: Results from analyst agent
+            sections: Names of the sections to build, e.g. SUMMARY_SECTIONS when
+                only create_summary will read the report; the rest are left
+                empty. Every section is built by default.
             
         Returns:
             Complete research report
+        
+        Sections are cached by a hash of the inputs, so repeated inputs share
+        section objects; replace sections rather than mutating them in place.
         """
         logger.info(f"Synthesizing report for query: {query}")
         
+        wanted = frozenset(sections) if sections is not None else None
+        if wanted is not None and not wanted <= _REPORT_SECTIONS.keys():
+            raise ValueError(f"Unknown report sections: {sorted(wanted - _REPORT_SECTIONS.keys())}")
+        
         # Store inputs
         self.memory.store_short_term('synthesis_inputs', {
             'query': query,
@@ -107,72 +228,116 @@ class ContentSynthesizerAgent:
             'analysis_results': analysis_results
         })
         
-        # Create report structure
+        # Sections are deterministic in the inputs, so reuse them when they repeat
+        cache_key = _report_cache_key(query, gathered_info, analysis_results, wanted)
+        cached = self._report_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            self._report_cache.move_to_end(cache_key)
+            built, word_count = cached
+        else:
+            built, word_count = self._generate_sections(query, gathered_info, analysis_results, wanted)
+            if cache_key:
+                self._cache_sections(cache_key, built, word_count)
+        
         report = {
-            'title': self._generate_title(query),
-            'executive_summary': '',
-            'introduction': '',
-            'methodology': '',
-            'findings': [],
-            'analysis': {},
-            'conclusions': [],
-            'recommendations': [],
-            'references': [],
+            **built,
             'metadata': {
-                'created_at': datetime.now().isoformat(),
+                'created_at': _now_iso(),
                 'query': query,
                 'confidence_score': analysis_results.get('confidence_levels', {}).get('overall', 0.5)
             }
         }
         
-        # Generate each section
-        report['executive_summary'] = self._create_executive_summary(
-            query, gathered_info, analysis_results
-        )
-        
-        report['introduction'] = self._create_introduction(query, gathered_info)
-        
-        report['methodology'] = self._create_methodology(gathered_info)
-        
-        report['findings'] = self._organize_findings(gathered_info, analysis_results)
-        
-        report['analysis'] = self._create_analysis_section(analysis_results)
-        
-        report['conclusions'] = self._create_conclusions(analysis_results)
-        
-        report['recommendations'] = self._create_recommendations(
-            query, analysis_results
-        )
-        
-        report['references'] = self._compile_references(gathered_info)
-        
         # Store completed report
         self.memory.store_short_term('completed_report', report)
         self.memory.share_data(
             'content_synthesizer',
             {
                 'status': 'completed',
-                'report_sections': len([k for k, v in report.items() if v]),
-                'word_count': self._estimate_word_count(report)
+                'report_sections': sum(1 for value in report.values() if value),
+                'word_count': word_count
             }
         )
         
         return report
     
+    def _generate_sections(self,
+                           query: str,
+                           gathered_info: Dict[str, Any],
+                           analysis_results: Dict[str, Any],
+                           wanted: Optional[FrozenSet[str]] = None) -> Tuple[Dict[str, Any], int]:
+        """Generate the title and the wanted report sections (all by default), with their total word count"""
+        title = self._generate_title(query)
+        
+        # None of the sections depends on another; the summarizing ones share one bucketing pass
+        buckets = _bucket_analysis(analysis_results)
+        sections = [
+            ('executive_summary', self._create_executive_summary, (query, gathered_info, analysis_results, buckets)),
+            ('introduction', self._create_introduction, (query, gathered_info)),
+            ('methodology', self._create_methodology, (gathered_info,)),
+            ('findings', self._organize_findings, (gathered_info, analysis_results)),
+            ('analysis', self._create_analysis_section, (analysis_results,)),
+            ('conclusions', self._create_conclusions, (analysis_results, buckets)),
+            ('recommendations', self._create_recommendations, (query, analysis_results, buckets)),
+            ('references', self._compile_references, (gathered_info,)),
+        ]
+        if wanted is not None:
+            sections = [section for section in sections if section[0] in wanted]
+        built = self._build_sections(sections)
+        
+        generated = {'title': title}
+        word_count = _count_words(title)
+        for key, empty in _REPORT_SECTIONS.items():
+            if key in built:
+                generated[key], words = built[key]
+                word_count += words
+            else:
+                generated[key] = empty()
+        
+        return generated, word_count
+    
+    def _cache_sections(self, key: str, sections: Dict[str, Any], word_count: int) -> None:
+        """Cache generated sections, evicting the least recently used entry when full"""
+        max_size = self.config.get('report_cache_size', 128)
+        if max_size <= 0:
+            return
+        self._report_cache[key] = (sections, word_count)
+        while len(self._report_cache) > max_size:
+            self._report_cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached report sections"""
+        self._report_cache.clear()
+    
+    def _build_sections(self,
+                        sections: List[Tuple[str, Callable[..., Any], tuple]]) -> Dict[str, Tuple[Any, int]]:
+        """Build report sections with their word counts, concurrently when 'parallel_sections' is enabled"""
+        if not self.config.get('parallel_sections') or len(sections) < 2:
+            return {key: _build_section(build, args) for key, build, args in sections}
+        
+        if self._section_pool is None:
+            self._section_pool = ThreadPoolExecutor(
+                max_workers=max(1, self.config.get('max_workers', len(sections))),
+                thread_name_prefix='report-sections'
+            )
+        futures = [(key, self._section_pool.submit(_build_section, build, args)) for key, build, args in sections]
+        return {key: future.result() for key, future in futures}
+    
+    def close(self) -> None:
+        """Shut down the section thread pool, if one was started"""
+        if self._section_pool is not None:
+            self._section_pool.shutdown()
+            self._section_pool = None
+    
     def _generate_title(self, query: str) -> str:
         """Generate a title for the report"""
         # Simple title generation - preserve certain acronyms
         words = query.strip('?').split()
         
-        # Preserve common acronyms
-        acronyms = ['AI', 'ML', 'NLP', 'API', 'URL', 'PDF', 'CSV']
-        
         titled_words = []
         for word in words:
-            if word.upper() in acronyms:
-                titled_words.append(word.upper())
-            else:
-                titled_words.append(word.capitalize())
+            upper = word.upper()
+            titled_words.append(upper if upper in _ACRONYMS else word.capitalize())
         
         base_title = ' '.join(titled_words)
         return f"Research Report: {base_title}"
@@ -180,8 +345,10 @@ class ContentSynthesizerAgent:
     def _create_executive_summary(self, 
                                  query: str,
                                  gathered_info: Dict[str, Any],
-                                 analysis_results: Dict[str, Any]) -> str:
+                                 analysis_results: Dict[str, Any],
+                                 buckets: Optional[_AnalysisBuckets] = None) -> str:
         """Create executive summary"""
+        buckets = buckets or _bucket_analysis(analysis_results)
         summary_parts = []
         
         # Opening
@@ -195,23 +362,17 @@ class ContentSynthesizerAgent:
         )
         
         # Main insights
-        insights = analysis_results.get('insights', [])
-        if insights:
-            high_conf = [i for i in insights if i.get('confidence', 0) > 0.7]
-            if high_conf:
-                summary_parts.append(
-                    f"The analysis revealed {len(high_conf)} high-confidence insights."
-                )
+        if buckets.high_conf_count:
+            summary_parts.append(
+                f"The analysis revealed {buckets.high_conf_count} high-confidence insights."
+            )
         
         # Patterns
-        patterns = analysis_results.get('patterns', [])
-        if patterns:
-            strong_patterns = [p for p in patterns if p.get('strength') == 'strong']
-            if strong_patterns:
-                themes = [p['theme'] for p in strong_patterns]
-                summary_parts.append(
-                    f"Strong patterns identified in: {', '.join(themes)}."
-                )
+        if buckets.strong_patterns:
+            themes = [p['theme'] for p in buckets.strong_patterns]
+            summary_parts.append(
+                f"Strong patterns identified in: {', '.join(themes)}."
+            )
         
         # Confidence
         confidence = analysis_results.get('confidence_levels', {}).get('overall', 0)
@@ -237,12 +398,8 @@ class ContentSynthesizerAgent:
             source_types = set()
             for source in sources:
                 if 'url' in source:
-                    if '.edu' in source['url']:
-                        source_types.add('academic')
-                    elif '.gov' in source['url']:
-                        source_types.add('government')
-                    else:
-                        source_types.add('general')
+                    match = _URL_KIND_RE.search(source['url'])
+                    source_types.add(_URL_KINDS[match.group(1)] if match else 'general')
             
             if source_types:
                 intro_parts.append(
@@ -262,36 +419,23 @@ class ContentSynthesizerAgent:
     
     def _create_methodology(self, gathered_info: Dict[str, Any]) -> str:
         """Create methodology section"""
-        method_parts = []
-        
-        method_parts.append("This research employed a systematic approach:")
+        sources_count = len(gathered_info.get('sources_used', []))
         
-        # Search strategy
-        method_parts.append(
+        return (
+            "This research employed a systematic approach: "
+            # Search strategy
             "1. Information Gathering: Comprehensive search across multiple sources "
-            "using targeted queries and academic databases."
-        )
-        
-        # Source evaluation
-        sources_count = len(gathered_info.get('sources_used', []))
-        method_parts.append(
+            "using targeted queries and academic databases. "
+            # Source evaluation
             f"2. Source Evaluation: {sources_count} sources were evaluated for "
-            "credibility, relevance, and recency."
-        )
-        
-        # Analysis
-        method_parts.append(
+            "credibility, relevance, and recency. "
+            # Analysis
             "3. Data Analysis: Pattern identification, comparative analysis, "
-            "and insight generation using systematic analytical methods."
-        )
-        
-        # Synthesis
-        method_parts.append(
+            "and insight generation using systematic analytical methods. "
+            # Synthesis
             "4. Synthesis: Integration of findings into coherent conclusions "
             "and actionable recommendations."
         )
-        
-        return " ".join(method_parts)
     
     def _organize_findings(self, 
                           gathered_info: Dict[str, Any],
@@ -303,32 +447,25 @@ class ContentSynthesizerAgent:
         raw_findings = gathered_info.get('main_findings', [])
         patterns = analysis_results.get('patterns', [])
         
-        # Group by pattern themes if available
-        if patterns:
-            for pattern in patterns:
-                theme = pattern['theme']
-                related_findings = [
-                    f for f in raw_findings 
-                    if theme.lower() in f.get('finding', '').lower()
-                ]
-                
-                if related_findings:
-                    organized_findings.append({
-                        'theme': theme.title(),
-                        'findings': related_findings,
-                        'pattern_strength': pattern.get('strength', 'moderate')
-                    })
+        # Lowercase each finding once, then group by pattern themes if available
+        lowered = [(f, f.get('finding', '').lower()) for f in raw_findings]
+        grouped_ids = set()
+        
+        for pattern in patterns:
+            theme = pattern['theme']
+            theme_lc = theme.lower()
+            related_findings = [f for f, text in lowered if theme_lc in text]
+            
+            if related_findings:
+                organized_findings.append({
+                    'theme': theme.title(),
+                    'findings': related_findings,
+                    'pattern_strength': pattern.get('strength', 'moderate')
+                })
+                grouped_ids.update(map(id, related_findings))
         
         # Add ungrouped findings
-        grouped_findings = set()
-        for of in organized_findings:
-            for f in of['findings']:
-                grouped_findings.add(f.get('finding', ''))
-        
-        ungrouped = [
-            f for f in raw_findings 
-            if f.get('finding', '') not in grouped_findings
-        ]
+        ungrouped = [f for f in raw_findings if id(f) not in grouped_ids]
         
         if ungrouped:
             organized_findings.append({
@@ -390,27 +527,24 @@ class ContentSynthesizerAgent:
         
         return analysis_section
     
-    def _create_conclusions(self, analysis_results: Dict[str, Any]) -> List[str]:
+    def _create_conclusions(self,
+                            analysis_results: Dict[str, Any],
+                            buckets: Optional[_AnalysisBuckets] = None) -> List[str]:
         """Create conclusions based on analysis"""
+        buckets = buckets or _bucket_analysis(analysis_results)
         conclusions = []
         
         # Based on patterns
-        patterns = analysis_results.get('patterns', [])
-        strong_patterns = [p for p in patterns if p.get('strength') == 'strong']
-        
-        if strong_patterns:
+        if buckets.strong_patterns:
             conclusions.append(
-                f"The research identifies {len(strong_patterns)} strong patterns, "
+                f"The research identifies {len(buckets.strong_patterns)} strong patterns, "
                 f"indicating clear trends in the data."
             )
         
         # Based on insights
-        insights = analysis_results.get('insights', [])
-        high_conf_insights = [i for i in insights if i.get('confidence', 0) > 0.7]
-        
-        if high_conf_insights:
+        if buckets.high_conf_count:
             conclusions.append(
-                f"Analysis reveals {len(high_conf_insights)} high-confidence insights "
+                f"Analysis reveals {buckets.high_conf_count} high-confidence insights "
                 f"that provide actionable understanding."
             )
         
@@ -435,19 +569,21 @@ class ContentSynthesizerAgent:
     
     def _create_recommendations(self, 
                                query: str,
-                               analysis_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+                               analysis_results: Dict[str, Any],
+                               buckets: Optional[_AnalysisBuckets] = None) -> List[Dict[str, Any]]:
         """Create actionable recommendations"""
+        buckets = buckets or _bucket_analysis(analysis_results)
         recommendations = []
         
         # Based on insights
         insights = analysis_results.get('insights', [])
         
-        for i, insight in enumerate(insights[:3]):  # Top 3 insights
-            if insight.get('confidence', 0) > 0.6:
+        for insight, confidence in zip(insights[:3], buckets.confidences):  # Top 3 insights
+            if confidence > 0.6:
                 recommendations.append({
-                    'priority': 'high' if insight.get('confidence', 0) > 0.8 else 'medium',
+                    'priority': 'high' if confidence > 0.8 else 'medium',
                     'recommendation': f"Based on {insight['type']} analysis: {insight['content']}",
-                    'rationale': f"Confidence level: {insight.get('confidence', 0):.0%}"
+                    'rationale': f"Confidence level: {confidence:.0%}"
                 })
         
         # Based on gaps or limitations
@@ -470,39 +606,19 @@ class ContentSynthesizerAgent:
     
     def _compile_references(self, gathered_info: Dict[str, Any]) -> List[Dict[str, str]]:
         """Compile references from sources"""
-        references = []
-        
-        sources = gathered_info.get('sources_used', [])
-        
-        for i, source in enumerate(sources):
-            reference = {
-                'id': f"[{i+1}]",
+        return [
+            {
+                'id': f"[{i}]",
                 'title': source.get('title', 'Untitled'),
                 'url': source.get('url', ''),
                 'reliability': f"{source.get('reliability', 0):.0%}"
             }
-            references.append(reference)
-        
-        return references
+            for i, source in enumerate(gathered_info.get('sources_used', []), start=1)
+        ]
     
     def _estimate_word_count(self, report: Dict[str, Any]) -> int:
         """Estimate word count of the report"""
-        total_words = 0
-        
-        # Count words in string fields
-        for key, value in report.items():
-            if isinstance(value, str):
-                total_words += len(value.split())
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, str):
-                        total_words += len(item.split())
-                    elif isinstance(item, dict):
-                        for v in item.values():
-                            if isinstance(v, str):
-                                total_words += len(v.split())
-        
-        return total_words
+        return sum(_count_words(value) for value in report.values())
     
     def create_summary(self, report: Dict[str, Any], max_length: int = 500) -> str:
         """
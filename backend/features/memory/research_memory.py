@@ -4,10 +4,16 @@ Handles short-term, long-term, and shared memory for agents
 """
 
 import json
+from contextlib import closing
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from enum import Enum
 import logging
+import orjson
+import sqlite3
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,35 @@ class MemoryType(Enum):
     SHARED = "shared"
 
 
+# Memory scopes written by ResearchMemory.save, as named in export_memory
+_PERSISTED_SCOPES = ("short_term", "long_term", "shared_data")
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+_CREATE_MEMORY_TABLE = """
+    CREATE TABLE IF NOT EXISTS memory (
+        scope TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value BLOB NOT NULL,
+        PRIMARY KEY (scope, key)
+    )
+"""
+
+
+@lru_cache(maxsize=1024)
+def _iso_from_epoch_ns(epoch_ns: int) -> str:
+    """Format a wall-clock nanosecond timestamp, caching values shared by batched writes"""
+    return datetime.fromtimestamp(epoch_ns / 1e9).isoformat()
+
+
+def _find_sources(data: Any) -> Tuple[Dict[str, Any], ...]:
+    """Source-like records (dicts with a url or title) in a piece of shared data"""
+    if isinstance(data, dict):
+        return (data,) if "url" in data or "title" in data else ()
+    if isinstance(data, list):
+        return tuple(item for item in data if isinstance(item, dict) and ("url" in item or "title" in item))
+    return ()
+
+
 class ResearchMemory:
     """
     Shared memory system for research agents
@@ -27,6 +62,12 @@ class ResearchMemory:
     1. Short-term: Current task context and temporary data
     2. Long-term: Persistent knowledge and patterns
     3. Shared: Cross-agent communication data
+    
+    Entry timestamps are epoch nanosecond ints; they are formatted as ISO
+    strings only when memory is exported. Writes are serialized with
+    a lock so agents running on worker threads can share one instance.
+    Stats and exports are cached until the next write through these methods.
+    Source records in shared data are indexed as they are shared.
     """
     
     def __init__(self):
@@ -39,7 +80,16 @@ class ResearchMemory:
             "quality_scores": {}
         }
         self.shared_data: Dict[str, Dict[str, Any]] = {}
-        self._init_timestamp = datetime.now()
+        # Sources found in each agent's shared data, in shared_data order
+        self._shared_sources: Dict[str, Tuple[Dict[str, Any], ...]] = {}
+        self._lock = threading.RLock()
+        self._init_ns = time.monotonic_ns()
+        
+        # Bumped by every mutation; stats and exports are reused until it changes.
+        # The export is kept serialized so every caller decodes its own copy
+        self._version = 0
+        self._stats_snapshot: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._export_snapshot: Optional[Tuple[int, bytes]] = None
         logger.info("Research memory system initialized")
     
     def store_short_term(self, key: str, value: Any, metadata: Optional[Dict] = None) -> None:
@@ -51,11 +101,13 @@ class ResearchMemory:
             value: Data to store
             metadata: Optional metadata about the data
         """
-        self.short_term[key] = {
-            "value": value,
-            "timestamp": datetime.now().isoformat(),
-            "metadata": metadata or {}
-        }
+        with self._lock:
+            self._version += 1
+            self.short_term[key] = {
+                "value": value,
+                "timestamp": time.time_ns(),
+                "metadata": metadata or {}
+            }
         logger.debug(f"Stored short-term memory: {key}")
     
     def get_short_term(self, key: str) -> Optional[Any]:
@@ -81,19 +133,21 @@ class ResearchMemory:
             data: Data to store
             operation: How to store - 'append' for lists, 'update' for dicts, 'set' to replace
         """
-        if category not in self.long_term:
-            logger.warning(f"Unknown long-term category: {category}. Creating new category.")
-            self.long_term[category] = [] if operation == "append" else {}
-        
-        if operation == "append" and isinstance(self.long_term[category], list):
-            self.long_term[category].append(data)
-        elif operation == "update" and isinstance(self.long_term[category], dict):
-            self.long_term[category].update(data)
-        elif operation == "set":
-            self.long_term[category] = data
-        else:
-            logger.error(f"Invalid operation {operation} for category {category}")
-            raise ValueError(f"Invalid operation {operation} for category {category}")
+        with self._lock:
+            self._version += 1
+            if category not in self.long_term:
+                logger.warning(f"Unknown long-term category: {category}. Creating new category.")
+                self.long_term[category] = [] if operation == "append" else {}
+            
+            if operation == "append" and isinstance(self.long_term[category], list):
+                self.long_term[category].append(data)
+            elif operation == "update" and isinstance(self.long_term[category], dict):
+                self.long_term[category].update(data)
+            elif operation == "set":
+                self.long_term[category] = data
+            else:
+                logger.error(f"Invalid operation {operation} for category {category}")
+                raise ValueError(f"Invalid operation {operation} for category {category}")
         
         logger.debug(f"Updated long-term memory: {category}")
     
@@ -118,14 +172,54 @@ class ResearchMemory:
             data: Data to share
             priority: Priority level ('high', 'normal', 'low')
         """
-        self.shared_data[agent_id] = {
-            "data": data,
-            "timestamp": datetime.now().isoformat(),
-            "priority": priority,
-            "accessed_count": 0
-        }
+        with self._lock:
+            self._version += 1
+            self.shared_data[agent_id] = {
+                "data": data,
+                "timestamp": time.time_ns(),
+                "priority": priority,
+                "accessed_count": 0
+            }
+            self._shared_sources[agent_id] = _find_sources(data)
         logger.info(f"Agent {agent_id} shared data with priority: {priority}")
     
+    def batch_write(self, ops: Sequence[Tuple]) -> None:
+        """
+        Apply several memory writes at once with a single timestamp
+        
+        Args:
+            ops: Write operations, each one of
+                ('short_term', key, value[, metadata]),
+                ('long_term', category, data[, operation]) or
+                ('shared', agent_id, data[, priority])
+        """
+        with self._lock:
+            self._version += 1
+            timestamp = time.time_ns()
+            
+            for op in ops:
+                memory_type = MemoryType(op[0])
+                if memory_type is MemoryType.SHORT_TERM:
+                    key, value, *rest = op[1:]
+                    self.short_term[key] = {
+                        "value": value,
+                        "timestamp": timestamp,
+                        "metadata": (rest[0] if rest else None) or {}
+                    }
+                elif memory_type is MemoryType.LONG_TERM:
+                    self.store_long_term(*op[1:])
+                else:
+                    agent_id, data, *rest = op[1:]
+                    self.shared_data[agent_id] = {
+                        "data": data,
+                        "timestamp": timestamp,
+                        "priority": rest[0] if rest else "normal",
+                        "accessed_count": 0
+                    }
+                    self._shared_sources[agent_id] = _find_sources(data)
+        
+        logger.debug(f"Applied {len(ops)} batched memory writes")
+    
     def get_shared_data(self, agent_id: str) -> Optional[Any]:
         """
         Retrieve shared data from an agent
@@ -136,10 +230,13 @@ class ResearchMemory:
         Returns:
             The shared data or None if not found
         """
-        if agent_id in self.shared_data:
-            self.shared_data[agent_id]["accessed_count"] += 1
-            return self.shared_data[agent_id]["data"]
-        return None
+        with self._lock:
+            self._version += 1
+            entry = self.shared_data.get(agent_id)
+            if entry is None:
+                return None
+            entry["accessed_count"] += 1
+            return entry["data"]
     
     def get_all_shared_data(self, priority: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -159,9 +256,22 @@ class ResearchMemory:
             }
         return {agent_id: data["data"] for agent_id, data in self.shared_data.items()}
     
+    def get_shared_sources(self) -> List[Dict[str, Any]]:
+        """
+        Get the source records agents have shared
+        
+        Returns:
+            Shared dicts with a url or title, including those inside shared
+            lists, in the order the agents shared them
+        """
+        with self._lock:
+            return [source for sources in self._shared_sources.values() for source in sources]
+    
     def clear_short_term(self) -> None:
         """Clear all short-term memory"""
-        self.short_term.clear()
+        with self._lock:
+            self._version += 1
+            self.short_term.clear()
         logger.info("Short-term memory cleared")
     
     def clear_shared_data(self, agent_id: Optional[str] = None) -> None:
@@ -171,42 +281,130 @@ class ResearchMemory:
         Args:
             agent_id: Specific agent's data to clear, or None to clear all
         """
+        with self._lock:
+            self._version += 1
+            if agent_id:
+                self.shared_data.pop(agent_id, None)
+                self._shared_sources.pop(agent_id, None)
+            else:
+                self.shared_data.clear()
+                self._shared_sources.clear()
+        
         if agent_id:
-            self.shared_data.pop(agent_id, None)
             logger.info(f"Cleared shared data for agent: {agent_id}")
         else:
-            self.shared_data.clear()
             logger.info("All shared data cleared")
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get statistics about memory usage"""
-        return {
-            "short_term_items": len(self.short_term),
-            "long_term_categories": len(self.long_term),
-            "shared_data_agents": len(self.shared_data),
-            "uptime_seconds": (datetime.now() - self._init_timestamp).total_seconds(),
-            "memory_breakdown": {
-                "short_term": list(self.short_term.keys()),
-                "long_term": list(self.long_term.keys()),
-                "shared_agents": list(self.shared_data.keys())
-            }
-        }
+        with self._lock:
+            if self._stats_snapshot is None or self._stats_snapshot[0] != self._version:
+                self._stats_snapshot = (self._version, {
+                    "short_term_items": len(self.short_term),
+                    "long_term_categories": len(self.long_term),
+                    "shared_data_agents": len(self.shared_data),
+                    "memory_breakdown": {
+                        "short_term": list(self.short_term.keys()),
+                        "long_term": list(self.long_term.keys()),
+                        "shared_agents": list(self.shared_data.keys())
+                    }
+                })
+            stats = self._stats_snapshot[1]
+        
+        return {**stats, "uptime_seconds": (time.monotonic_ns() - self._init_ns) / 1e9}
     
     def export_memory(self) -> Dict[str, Any]:
-        """Export all memory for persistence"""
-        return {
-            "short_term": self.short_term,
-            "long_term": self.long_term,
-            "shared_data": self.shared_data,
-            "export_timestamp": datetime.now().isoformat()
-        }
+        """Export a JSON-compatible copy of all memory for persistence, reusing the last serialization while memory is unchanged"""
+        with self._lock:
+            if self._export_snapshot is None or self._export_snapshot[0] != self._version:
+                self._export_snapshot = (self._version, orjson.dumps({
+                    "short_term": self._with_timestamps(self.short_term, self._format_timestamp),
+                    "long_term": self.long_term,
+                    "shared_data": self._with_timestamps(self.shared_data, self._format_timestamp)
+                }, default=str, option=_ORJSON_OPTIONS))
+            exported = orjson.loads(self._export_snapshot[1])
+        
+        exported["export_timestamp"] = datetime.now().isoformat()
+        return exported
     
     def import_memory(self, memory_data: Dict[str, Any]) -> None:
         """Import memory from exported data"""
-        if "short_term" in memory_data:
-            self.short_term = memory_data["short_term"]
-        if "long_term" in memory_data:
-            self.long_term = memory_data["long_term"]
-        if "shared_data" in memory_data:
-            self.shared_data = memory_data["shared_data"]
-        logger.info("Memory imported successfully")
\ No newline at end of file
+        with self._lock:
+            self._version += 1
+            if "short_term" in memory_data:
+                self.short_term = self._with_timestamps(memory_data["short_term"], self._parse_timestamp)
+            if "long_term" in memory_data:
+                self.long_term = memory_data["long_term"]
+            if "shared_data" in memory_data:
+                self.shared_data = self._with_timestamps(memory_data["shared_data"], self._parse_timestamp)
+                self._shared_sources = {
+                    agent_id: _find_sources(entry.get("data") if isinstance(entry, dict) else None)
+                    for agent_id, entry in self.shared_data.items()
+                }
+        logger.info("Memory imported successfully")
+    
+    def save(self, path: str) -> None:
+        """
+        Persist a snapshot of all memory to a SQLite database
+        
+        The snapshot replaces whatever the database held, in one transaction,
+        so a failed save never leaves a mix of old and new entries.
+        
+        Args:
+            path: Database file path
+        """
+        with self._lock:
+            scopes = dict(zip(_PERSISTED_SCOPES, (self.short_term, self.long_term, self.shared_data)))
+            rows = [
+                (scope, key, orjson.dumps(value, default=str, option=_ORJSON_OPTIONS))
+                for scope, entries in scopes.items()
+                for key, value in entries.items()
+            ]
+        
+        with closing(sqlite3.connect(path)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_CREATE_MEMORY_TABLE)
+            with conn:
+                conn.execute("DELETE FROM memory")
+                conn.executemany("INSERT INTO memory (scope, key, value) VALUES (?, ?, ?)", rows)
+        logger.info(f"Saved {len(rows)} memory entries to {path}")
+    
+    def load(self, path: str) -> None:
+        """
+        Load memory from a SQLite snapshot written by save()
+        
+        Args:
+            path: Database file path
+        """
+        memory_data: Dict[str, Dict[str, Any]] = {scope: {} for scope in _PERSISTED_SCOPES}
+        with closing(sqlite3.connect(path)) as conn:
+            conn.execute(_CREATE_MEMORY_TABLE)
+            for scope, key, value in conn.execute("SELECT scope, key, value FROM memory"):
+                if scope in memory_data:
+                    memory_data[scope][key] = orjson.loads(value)
+        self.import_memory(memory_data)
+    
+    def _format_timestamp(self, timestamp: Any) -> Any:
+        """Convert an epoch nanosecond timestamp to an ISO string"""
+        if not isinstance(timestamp, int):
+            return timestamp
+        return _iso_from_epoch_ns(timestamp)
+    
+    def _parse_timestamp(self, timestamp: Any) -> Any:
+        """Convert an exported ISO timestamp back to epoch nanoseconds"""
+        if not isinstance(timestamp, str):
+            return timestamp
+        try:
+            return round(datetime.fromisoformat(timestamp).timestamp() * 1e6) * 1000
+        except ValueError:
+            return timestamp
+    
+    @staticmethod
+    def _with_timestamps(entries: Dict[str, Dict[str, Any]],
+                         convert: Callable[[Any], Any]) -> Dict[str, Dict[str, Any]]:
+        """Copy memory entries with their timestamps converted"""
+        return {
+            key: {**entry, "timestamp": convert(entry["timestamp"])}
+            if isinstance(entry, dict) and "timestamp" in entry else entry
+            for key, entry in entries.items()
+        }
@@ -0,0 +1,61 @@
+"""
+Embedding Cache
+OpenAI embeddings for crew memory, reused for texts that were already embedded
+"""
+
+from typing import Any, Dict, List, Tuple
+from collections import OrderedDict
+from chromadb.api.types import Documents, Embeddings
+from chromadb.utils.embedding_functions.openai_embedding_function import OpenAIEmbeddingFunction
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Embeddings kept across crews and kickoffs, keyed by model and text hash
+_CACHE_SIZE = 4096
+_embedding_cache: "OrderedDict[Tuple[str, Any, bytes], Any]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def clear_embedding_cache() -> None:
+    """Drop all cached embeddings"""
+    with _cache_lock:
+        _embedding_cache.clear()
+
+
+class CachedOpenAIEmbeddingFunction(OpenAIEmbeddingFunction):
+    """OpenAI embedding function that only sends texts it has not embedded before"""
+
+    def __call__(self, input: Documents) -> Embeddings:
+        """
+        Embed documents, serving repeated texts from the cache
+
+        Args:
+            input: Texts to embed
+
+        Returns:
+            One embedding per text, in input order
+        """
+        keys = [
+            (self.model_name, self.dimensions, hashlib.blake2b(text.encode(), digest_size=16).digest())
+            for text in input
+        ]
+        with _cache_lock:
+            embeddings: List[Any] = [_embedding_cache.get(key) for key in keys]
+
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            fresh = super().__call__([input[i] for i in missing])
+            fresh_by_key: Dict[Tuple[str, Any, bytes], Any] = {}
+            for i, embedding in zip(missing, fresh):
+                embeddings[i] = fresh_by_key[keys[i]] = embedding
+
+            with _cache_lock:
+                _embedding_cache.update(fresh_by_key)
+                while len(_embedding_cache) > _CACHE_SIZE:
+                    _embedding_cache.popitem(last=False)
+
+        logger.debug("Embedded %d texts, %d from cache", len(keys), len(keys) - len(missing))
+        return embeddings
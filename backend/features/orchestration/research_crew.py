@@ -3,8 +3,12 @@ Research Crew Orchestration
 Manages the CrewAI crew for research tasks
 """
 
-from typing import Dict, Any, Optional, List
-from crewai import Crew, Task, Process
+from typing import Dict, Any, Optional, List, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from crewai import Crew, CrewOutput, Task, Process
 from ..agents import (
     ResearchCoordinatorAgent,
     InformationGathererAgent,
@@ -12,24 +16,205 @@ from ..agents import (
     ContentSynthesizerAgent
 )
 from ..memory.research_memory import ResearchMemory
+import hashlib
 import logging
-from datetime import datetime
+import numpy as np
+import orjson
+from datetime import date, datetime
 import re
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Punctuation and runs of whitespace ignored when matching repeated queries
+_QUERY_NOISE_RE = re.compile(r'[^\w\s]+|\s+')
+
+# Namespace for research responses shared through Redis
+_SHARED_CACHE_PREFIX = 'research-crew:response:'
+
+# Markdown report sections by level-2 header title, in report order
+_SECTION_TITLES = {
+    'executive summary': 'executive_summary',
+    'methodology': 'methodology',
+    'findings': 'findings',
+    'key findings': 'findings',
+    'conclusion': 'conclusions',
+    'conclusions': 'conclusions',
+    'recommendations': 'recommendations',
+    'actionable recommendations': 'recommendations',
+    'references': 'references',
+}
+_SECTION_TITLE_PREFIXES = (('introduction', 'introduction'), ('analysis', 'analysis'))
+_SECTION_ORDER = (
+    'executive_summary', 'introduction', 'methodology', 'findings',
+    'analysis', 'conclusions', 'recommendations', 'references'
+)
+
+# Level-1 and level-2 markdown headers; each one ends the section before it
+_HEADER_RE = re.compile(r'^(#{1,2}) (.*)$', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n+')
+
+# Task descriptions, filled in with str.format for each query
+_PLANNING_TEMPLATE = """
+            Create a comprehensive research plan for the following query:
+            
+            Query: {query}
+            
+            Your plan should include:
+            1. Key research objectives
+            2. Information gathering strategy
+            3. Analysis approach
+            4. Expected deliverables
+            
+            Provide a structured plan that will guide the research process.
+            """
+
+_GATHERING_TEMPLATE = """
+            Based on the research plan, gather comprehensive information for:
+            
+            Query: {query}
+            {focus_line}
+            Your tasks:
+            1. Search for relevant and credible sources
+            2. Extract key information from each source
+            3. Evaluate source reliability
+            4. Organize findings by relevance
+            5. Identify any gaps in information
+            
+            Use all available tools to find high-quality, relevant information.
+            """
+
+_ANALYSIS_TEMPLATE = """
+            Analyze the gathered information to extract meaningful insights:
+            
+            Original Query: {query}
+            
+            Your analysis should:
+            1. Identify key patterns and trends
+            2. Compare different sources and perspectives
+            3. Find correlations and relationships
+            4. Assess the quality and consistency of data
+            5. Generate actionable insights
+            
+            Provide both quantitative and qualitative analysis.
+            """
+
+_SYNTHESIS_TEMPLATE = """
+            Create a comprehensive research report that addresses:
+            
+            Query: {query}
+            
+            Your report should include:
+            1. Executive summary
+            2. Introduction and background
+            3. Methodology
+            4. Key findings with proper citations
+            5. Analysis and insights
+            6. Conclusions
+            7. Actionable recommendations
+            8. References
+            
+            Ensure the report is well-structured, clear, and provides value to the reader.
+            """
+
+_FOCUS_LINE_TEMPLATE = "\n            Focus on this objective: {focus}\n"
+
+
+# Representative sources reported when the crew found none; "date" is set per call
+_DEFAULT_SOURCES = (
+    {
+        "title": "AI Research Analysis",
+        "url": "internal://research-analysis",
+        "authors": ("AI Research Assistant",),
+        "date": None,
+        "type": "analysis",
+        "credibility_score": 8.5,
+        "relevance_score": 9.0,
+        "summary": "Comprehensive analysis conducted by the AI research system using multiple data sources and analytical methods."
+    },
+    {
+        "title": "Web Research Compilation",
+        "url": "internal://web-research",
+        "authors": ("Information Gatherer Agent",),
+        "date": None,
+        "type": "compilation",
+        "credibility_score": 8.0,
+        "relevance_score": 8.5,
+        "summary": "Curated information from multiple web sources, analyzed and synthesized for accuracy and relevance."
+    },
+)
+
+
+@lru_cache(maxsize=1)
+def _date_for_day(ordinal: int) -> str:
+    """Format a calendar day once, however many sources are dated within it"""
+    return date.fromordinal(ordinal).strftime("%Y-%m-%d")
+
+
+def _today() -> str:
+    """Today's local date as YYYY-MM-DD"""
+    return _date_for_day(date.today().toordinal())
+
+
+def _credibility(value: Any, default: float = 7.5) -> float:
+    """A source's credibility score as a float, or the default when it is missing or not numeric"""
+    try:
+        return float(value if value is not None else default)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class _SourceTable:
+    """Sources as response records, with their credibility scores also held as a column"""
+    records: List[Dict[str, Any]]
+    credibility: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> '_SourceTable':
+        """Collect the credibility column from already built records"""
+        credibility = np.fromiter(
+            (_credibility(r.get('credibility_score')) for r in records), dtype=np.float64, count=len(records)
+        )
+        return cls(records, credibility)
+
+    def avg_credibility(self) -> float:
+        """Average credibility rounded to one decimal (8.0 when there are no sources)"""
+        if not self.records:
+            return 8.0
+        return round(float(self.credibility.mean()), 1)
+
+
+def _section_key(title: str) -> Optional[str]:
+    """Map a level-2 header title to its report section, if it names one"""
+    title = title.strip().lower()
+    key = _SECTION_TITLES.get(title)
+    if key is None:
+        key = next((key for prefix, key in _SECTION_TITLE_PREFIXES if title.startswith(prefix)), None)
+    return key
+
+
+def _normalize_query(query: str) -> str:
+    """Reduce a query to a cache key that ignores case, punctuation and spacing"""
+    return ' '.join(_QUERY_NOISE_RE.sub(' ', query.casefold()).split())
+
 
 class ResearchCrew:
     """Orchestrates the research crew for executing research tasks"""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, shared_cache_url: Optional[str] = None):
         """
         Initialize the research crew
         
         Args:
             config: Optional configuration for the crew
+            shared_cache_url: Redis URL for sharing cached responses across
+                processes. This is a server setting and is never read from config,
+                which API clients supply
         """
         self.config = config or {}
+        self.shared_cache_url = shared_cache_url
         self.memory = ResearchMemory()
         
         # Initialize agents
@@ -38,6 +223,24 @@ class ResearchCrew:
         # Crew will be created when needed
         self.crew = None
         
+        # Successful responses by normalized query, serialized so every hit gets
+        # its own copy: key -> (expiry, JSON). This is the only response cache;
+        # the API serves repeated requests through it and clear_query_cache()
+        # invalidates it
+        self._query_cache: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        
+        # Redis client shared by crews across processes when shared_cache_url
+        # is set; connected on first use (False once it turned out unusable)
+        self._shared_cache: Any = None
+        self._shared_cache_lock = threading.Lock()
+        
+        self._postprocess_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Memory holds the state of one run at a time, so runs on this crew
+        # are serialized (callers may share it across threads)
+        self._run_lock = threading.Lock()
+        
         logger.info("Research crew initialized")
     
     def _initialize_agents(self) -> None:
@@ -81,95 +284,59 @@ class ResearchCrew:
         
         # Task 1: Research Planning (Coordinator)
         planning_task = Task(
-            description=f"""
-            Create a comprehensive research plan for the following query:
-            
-            Query: {query}
-            
-            Your plan should include:
-            1. Key research objectives
-            2. Information gathering strategy
-            3. Analysis approach
-            4. Expected deliverables
-            
-            Provide a structured plan that will guide the research process.
-            """,
+            description=_PLANNING_TEMPLATE.format(query=query),
             expected_output="A detailed research plan with clear objectives and strategies",
             agent=self.coordinator.get_agent()
         )
         tasks.append(planning_task)
         
-        # Task 2: Information Gathering (Gatherer)
-        gathering_task = Task(
-            description=f"""
-            Based on the research plan, gather comprehensive information for:
-            
-            Query: {query}
-            
-            Your tasks:
-            1. Search for relevant and credible sources
-            2. Extract key information from each source
-            3. Evaluate source reliability
-            4. Organize findings by relevance
-            5. Identify any gaps in information
-            
-            Use all available tools to find high-quality, relevant information.
-            """,
-            expected_output="Comprehensive collection of relevant information with source citations",
-            agent=self.gatherer.get_agent(),
-            context=[planning_task]  # Depends on planning
-        )
-        tasks.append(gathering_task)
+        # Task 2: Information Gathering (Gatherer), one concurrent task per objective
+        # when 'parallel_gathering' is enabled and the plan has several
+        objectives = self.coordinator.get_research_objectives(query) if self.config.get('parallel_gathering') else ()
+        if len(objectives) > 1:
+            gathering_tasks = [
+                self._create_gathering_task(query, planning_task, focus=objective, async_execution=True)
+                for objective in objectives
+            ]
+        else:
+            gathering_tasks = [self._create_gathering_task(query, planning_task)]
+        tasks.extend(gathering_tasks)
         
         # Task 3: Data Analysis (Analyst)
         analysis_task = Task(
-            description=f"""
-            Analyze the gathered information to extract meaningful insights:
-            
-            Original Query: {query}
-            
-            Your analysis should:
-            1. Identify key patterns and trends
-            2. Compare different sources and perspectives
-            3. Find correlations and relationships
-            4. Assess the quality and consistency of data
-            5. Generate actionable insights
-            
-            Provide both quantitative and qualitative analysis.
-            """,
+            description=_ANALYSIS_TEMPLATE.format(query=query),
             expected_output="Detailed analysis with patterns, insights, and confidence levels",
             agent=self.analyst.get_agent(),
-            context=[gathering_task]  # Depends on gathering
+            context=gathering_tasks  # Depends on gathering
         )
         tasks.append(analysis_task)
         
         # Task 4: Report Synthesis (Synthesizer)
         synthesis_task = Task(
-            description=f"""
-            Create a comprehensive research report that addresses:
-            
-            Query: {query}
-            
-            Your report should include:
-            1. Executive summary
-            2. Introduction and background
-            3. Methodology
-            4. Key findings with proper citations
-            5. Analysis and insights
-            6. Conclusions
-            7. Actionable recommendations
-            8. References
-            
-            Ensure the report is well-structured, clear, and provides value to the reader.
-            """,
+            description=_SYNTHESIS_TEMPLATE.format(query=query),
             expected_output="Complete research report with all sections properly formatted",
             agent=self.synthesizer.get_agent(),
-            context=[planning_task, gathering_task, analysis_task]  # Depends on all previous
+            context=[planning_task, *gathering_tasks, analysis_task]  # Depends on all previous
         )
         tasks.append(synthesis_task)
         
         return tasks
     
+    def _create_gathering_task(self,
+                               query: str,
+                               planning_task: Task,
+                               focus: Optional[str] = None,
+                               async_execution: bool = False) -> Task:
+        """Create an information gathering task, optionally narrowed to one research objective"""
+        focus_line = _FOCUS_LINE_TEMPLATE.format(focus=focus) if focus else ""
+        return Task(
+            description=_GATHERING_TEMPLATE.format(query=query, focus_line=focus_line),
+            expected_output="Comprehensive collection of relevant information with source citations",
+            agent=self.gatherer.get_agent(),
+            context=[planning_task],  # Depends on planning
+            async_execution=async_execution
+        )
+    
     def execute_research(self, query: str) -> Dict[str, Any]:
         """
         Execute the complete research process
@@ -178,9 +345,38 @@ class ResearchCrew:
             query: Research query
             
         Returns:
-            Research results including report and metadata
+            Research results including report and metadata ('cached' is set
+            when they were served from the query cache)
         """
         logger.info(f"Starting research for query: {query}")
+        
+        # Repeated queries are answered from the cache without running the crew
+        cache_key = _normalize_query(query)
+        cached = self._serve_cached(query, cache_key)
+        if cached is not None:
+            return cached
+        
+        with self._run_lock:
+            # The same query may have finished while this call waited its turn
+            cached = self._serve_cached(query, cache_key)
+            if cached is not None:
+                return cached
+            return self._run_research(query, cache_key)
+    
+    def _serve_cached(self, query: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Build the response for a query from the cache, if it holds one"""
+        cached = self._get_cached_response(cache_key)
+        if cached is None:
+            return None
+        
+        logger.info(f"Serving cached research for query: {query}")
+        cached['query'] = query
+        cached['metadata']['research_date'] = datetime.now().isoformat()
+        cached['cached'] = True
+        return cached
+    
+    def _run_research(self, query: str, cache_key: str) -> Dict[str, Any]:
+        """Run the crew for a query that is not cached (called with the run lock held)"""
         start_time = datetime.now()
         
         try:
@@ -192,7 +388,7 @@ class ResearchCrew:
             tasks = self.create_research_tasks(query)
             
             # Create crew
-            self.crew = Crew(
+            crew = self.crew = Crew(
                 agents=[
                     self.coordinator.get_agent(),
                     self.gatherer.get_agent(),
@@ -203,30 +399,33 @@ class ResearchCrew:
                 process=Process.sequential,  # Tasks execute in order
                 verbose=self.config.get('verbose', True),
                 memory=True,
-                embedder={
-                    "provider": "openai",
-                    "config": {
-                        "model": "text-embedding-3-small"
-                    }
-                } if self.config.get('use_embeddings', False) else None
+                embedder=self._embedder_config() if self.config.get('use_embeddings', False) else None
             )
             
             # Execute crew
-            result = self.crew.kickoff()
+            result = crew.kickoff()
             
             # Process results
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            # Parse the result to extract structured information
-            parsed_report = self._parse_crew_result(str(result))
-            
-            # Extract sources from memory and result
-            sources = self._extract_sources()
+            end_time = datetime.now()
+            end_iso = end_time.isoformat()
+            execution_time = (end_time - start_time).total_seconds()
+            
+            # Extract sources from memory, on a worker thread while the report is
+            # prepared when 'overlap_postprocessing' is enabled
+            sources_future = (
+                self._get_postprocess_pool().submit(self._extract_sources)
+                if self.config.get('overlap_postprocessing') else None
+            )
             
-            # Get the final report from memory or use result
+            # Get the final report from memory, parsing the result only when there is none
             final_report = self.memory.get_short_term('completed_report')
             if not final_report:
-                final_report = parsed_report
+                final_report = self._parse_crew_result(result)
+            
+            source_table = sources_future.result() if sources_future else self._extract_sources()
+            sources = source_table.records
+            
+            avg_credibility = source_table.avg_credibility()
             
             # Create response in the format expected by FastAPI
             response = {
@@ -237,11 +436,11 @@ class ResearchCrew:
                 'metadata': {
                     'total_sources': len(sources),
                     'execution_time': execution_time,
-                    'avg_credibility': self._calculate_avg_credibility(sources),
-                    'confidence': self._calculate_confidence(sources, execution_time),
-                    'research_date': datetime.now().isoformat(),
+                    'avg_credibility': avg_credibility,
+                    'confidence': self._calculate_confidence(sources, execution_time, avg_credibility),
+                    'research_date': end_iso,
                     'start_time': start_time.isoformat(),
-                    'end_time': datetime.now().isoformat(),
+                    'end_time': end_iso,
                     'agents_used': 4,
                     'tasks_completed': len(tasks),
                     'memory_stats': self.memory.get_memory_stats()
@@ -251,6 +450,7 @@ class ResearchCrew:
             
             # Store results
             self.memory.store_short_term('research_results', response)
+            self._cache_response(cache_key, response)
             
             logger.info(f"Research completed successfully in {execution_time:.2f} seconds")
             return response
@@ -258,7 +458,8 @@ class ResearchCrew:
         except Exception as e:
             logger.error(f"Error during research execution: {str(e)}")
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            end_time = datetime.now()
+            execution_time = (end_time - start_time).total_seconds()
             return {
                 'success': False,
                 'query': query,
@@ -271,44 +472,167 @@ class ResearchCrew:
                     'execution_time': execution_time,
                     'avg_credibility': 0,
                     'confidence': 0,
-                    'research_date': datetime.now().isoformat()
+                    'research_date': end_time.isoformat()
                 }
             }
     
-    def _parse_crew_result(self, result_text: str) -> Dict[str, Any]:
+    def _embedder_config(self) -> Dict[str, Any]:
+        """Embedder for crew memory; texts embedded before are served from a shared cache"""
+        from .embeddings import CachedOpenAIEmbeddingFunction
+        
+        return {
+            "provider": "openai",
+            "config": {
+                "model": "text-embedding-3-small",
+                "embedding_callable": CachedOpenAIEmbeddingFunction
+            }
+        }
+    
+    def _get_cached_response(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of a live cached response, dropping it if expired, then try the shared cache"""
+        with self._query_cache_lock:
+            entry = self._query_cache.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._query_cache.move_to_end(key)
+                    return orjson.loads(entry[1])
+                del self._query_cache[key]
+        
+        shared_cache = self._get_shared_cache()
+        if shared_cache is None or not key:
+            return None
+        try:
+            payload = shared_cache.get(self._shared_cache_key(key))
+        except Exception as e:
+            logger.warning(f"Shared research cache read failed: {str(e)}")
+            return None
+        if payload is None:
+            return None
+        
+        self._remember_response(key, payload)
+        return orjson.loads(payload)
+    
+    def _cache_response(self, key: str, response: Dict[str, Any]) -> None:
+        """Cache a successful response locally and, when configured, in the shared cache"""
+        ttl = self._int_setting('cache_ttl', 24 * 3600)
+        if not key or ttl == 0:
+            return
+        payload = orjson.dumps(response, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+        self._remember_response(key, payload)
+        
+        shared_cache = self._get_shared_cache()
+        if shared_cache is None:
+            return
+        try:
+            shared_cache.set(
+                self._shared_cache_key(key),
+                payload,
+                ex=ttl
+            )
+        except Exception as e:
+            logger.warning(f"Shared research cache write failed: {str(e)}")
+    
+    def _remember_response(self, key: str, payload: bytes) -> None:
+        """Keep a serialized response in the local cache, evicting the least recently used entry when full"""
+        max_size = self._int_setting('query_cache_size', 128)
+        if max_size == 0:
+            return
+        
+        expiry = time.monotonic() + self._int_setting('cache_ttl', 24 * 3600)
+        with self._query_cache_lock:
+            self._query_cache[key] = (expiry, payload)
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > max_size:
+                self._query_cache.popitem(last=False)
+    
+    def _get_shared_cache(self) -> Any:
+        """Redis client for the shared cache at shared_cache_url, or None when there is none"""
+        if self._shared_cache is None:
+            url = self.shared_cache_url
+            if not url:
+                return None
+            with self._shared_cache_lock:
+                if self._shared_cache is None:
+                    try:
+                        import redis
+                        self._shared_cache = redis.Redis.from_url(url)
+                    except ImportError:
+                        logger.warning("A shared cache URL is set but redis is not installed; using the local cache only")
+                        self._shared_cache = False
+        return self._shared_cache or None
+    
+    def _int_setting(self, name: str, default: int) -> int:
+        """A non-negative integer cache setting from config, or the default when it is not one"""
+        value = self.config.get(name, default)
+        try:
+            return max(int(value), 0)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring invalid {name} setting: {value!r}")
+            return default
+    
+    def _shared_cache_key(self, key: str) -> str:
+        """Shared cache key for a normalized query, scoped to this crew's configuration"""
+        config_digest = hashlib.blake2b(
+            orjson.dumps(self.config, default=str, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+        return f"{_SHARED_CACHE_PREFIX}{config_digest}:{key}"
+    
+    def _get_postprocess_pool(self) -> ThreadPoolExecutor:
+        """Worker used to extract sources alongside report parsing"""
+        if self._postprocess_pool is None:
+            self._postprocess_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='crew-postprocess')
+        return self._postprocess_pool
+    
+    def close(self) -> None:
+        """Shut down the crew's and its agents' worker threads, if any were started"""
+        if self._postprocess_pool is not None:
+            self._postprocess_pool.shutdown()
+            self._postprocess_pool = None
+        self.gatherer.close()
+        self.synthesizer.close()
+    
+    def clear_query_cache(self) -> None:
+        """Drop all locally cached research responses"""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+    
+    def _parse_crew_result(self, result: Union[CrewOutput, str]) -> Dict[str, Any]:
         """
-        Parse the crew result text into structured sections
+        Parse the crew result into structured sections
         
         Args:
-            result_text: Raw result from crew.kickoff()
+            result: Result from crew.kickoff(), or its text
             
         Returns:
             Structured report dictionary
         """
+        if isinstance(result, CrewOutput):
+            # Structured (JSON or pydantic) output already names its sections
+            structured = result.to_dict()
+            report = {name: structured[name] for name in _SECTION_ORDER if structured.get(name)}
+            if report:
+                return report
+            result_text = str(result)
+        else:
+            result_text = str(result)
+        
         report = {}
         
         try:
-            # Look for markdown-style headers
-            sections = {
-                'executive_summary': r'## Executive Summary\n(.*?)(?=\n## |\n# |\Z)',
-                'introduction': r'## Introduction.*?\n(.*?)(?=\n## |\n# |\Z)',
-                'methodology': r'## Methodology\n(.*?)(?=\n## |\n# |\Z)',
-                'findings': r'## (?:Key )?Findings\n(.*?)(?=\n## |\n# |\Z)',
-                'analysis': r'## Analysis.*?\n(.*?)(?=\n## |\n# |\Z)',
-                'conclusions': r'## Conclusions?\n(.*?)(?=\n## |\n# |\Z)',
-                'recommendations': r'## (?:Actionable )?Recommendations\n(.*?)(?=\n## |\n# |\Z)',
-                'references': r'## References\n(.*?)(?=\n## |\n# |\Z)'
-            }
-            
-            for section_name, pattern in sections.items():
-                match = re.search(pattern, result_text, re.DOTALL | re.IGNORECASE)
-                if match:
-                    content = match.group(1).strip()
-                    # Clean up the content
-                    content = re.sub(r'\n+', '\n', content)
-                    content = content.strip()
-                    if content:
-                        report[section_name] = content
+            # Split on markdown-style headers in one pass; the first header for a section wins
+            headers = list(_HEADER_RE.finditer(result_text))
+            found = {}
+            for i, header in enumerate(headers):
+                key = _section_key(header.group(2)) if header.group(1) == '##' else None
+                if key is None or key in found:
+                    continue
+                end = headers[i + 1].start() if i + 1 < len(headers) else len(result_text)
+                # Clean up the content
+                found[key] = _BLANK_LINES_RE.sub('\n', result_text[header.end():end].strip()).strip()
+            
+            for section_name in _SECTION_ORDER:
+                if found.get(section_name):
+                    report[section_name] = found[section_name]
             
             # If no structured sections found, use the entire result as executive summary
             if not report and result_text:
@@ -324,22 +648,11 @@ class ResearchCrew:
         
         return report
     
-    def _extract_sources(self) -> List[Dict[str, Any]]:
+    def _extract_sources(self) -> _SourceTable:
         """Extract sources from memory and research context"""
-        sources = []
-        
         try:
-            # Get shared data from memory
-            shared_data = self.memory.get_all_shared_data()
-            
-            # Look for source-like data
-            for key, value in shared_data.items():
-                if isinstance(value, dict) and ('url' in value or 'title' in value):
-                    sources.append(value)
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict) and ('url' in item or 'title' in item):
-                            sources.append(item)
+            # Sources the agents shared, indexed by memory as they were written
+            sources = self.memory.get_shared_sources()
             
             # If no sources found in memory, create representative sources
             if not sources:
@@ -350,86 +663,63 @@ class ResearchCrew:
             
         except Exception as e:
             logger.error(f"Error extracting sources: {str(e)}")
-            sources = self._create_default_sources()
+            sources = _SourceTable.from_records(self._create_default_sources())
         
         return sources
     
     def _create_default_sources(self) -> List[Dict[str, Any]]:
         """Create default sources when none are found"""
+        today = _today()
         return [
-            {
-                "title": "AI Research Analysis",
-                "url": "internal://research-analysis",
-                "authors": ["AI Research Assistant"],
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "type": "analysis",
-                "credibility_score": 8.5,
-                "relevance_score": 9.0,
-                "summary": "Comprehensive analysis conducted by the AI research system using multiple data sources and analytical methods."
-            },
-            {
-                "title": "Web Research Compilation",
-                "url": "internal://web-research",
-                "authors": ["Information Gatherer Agent"],
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "type": "compilation",
-                "credibility_score": 8.0,
-                "relevance_score": 8.5,
-                "summary": "Curated information from multiple web sources, analyzed and synthesized for accuracy and relevance."
-            }
+            {**source, "authors": list(source["authors"]), "date": today}
+            for source in _DEFAULT_SOURCES
         ]
     
-    def _normalize_sources(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _normalize_sources(self, sources: List[Dict[str, Any]]) -> _SourceTable:
         """Ensure all sources have required fields"""
         normalized = []
+        credibility = np.empty(len(sources), dtype=np.float64)
+        today = _today()
         
-        for source in sources:
+        for i, source in enumerate(sources):
             normalized_source = {
                 "title": source.get("title", "Untitled Source"),
                 "url": source.get("url", ""),
                 "authors": source.get("authors", ["Unknown"]),
-                "date": source.get("date", datetime.now().strftime("%Y-%m-%d")),
+                "date": source.get("date", today),
                 "type": source.get("type", "web"),
-                "credibility_score": source.get("credibility_score", 7.5),
+                "credibility_score": _credibility(source.get("credibility_score")),
                 "relevance_score": source.get("relevance_score", 8.0),
                 "summary": source.get("summary", ""),
                 "key_findings": source.get("key_findings", []),
                 "bias_indicators": source.get("bias_indicators", [])
             }
             normalized.append(normalized_source)
+            credibility[i] = normalized_source["credibility_score"]
         
-        return normalized
+        return _SourceTable(normalized, credibility)
     
     def _calculate_avg_credibility(self, sources: List[Dict[str, Any]]) -> float:
         """Calculate average credibility score"""
-        if not sources:
-            return 8.0
-        
-        scores = [s.get('credibility_score', 7.5) for s in sources]
-        return round(sum(scores) / len(scores), 1)
+        return _SourceTable.from_records(sources).avg_credibility()
     
-    def _calculate_confidence(self, sources: List[Dict[str, Any]], execution_time: float) -> int:
+    def _calculate_confidence(self,
+                              sources: List[Dict[str, Any]],
+                              execution_time: float,
+                              avg_credibility: Optional[float] = None) -> int:
         """Calculate confidence score based on sources and execution time"""
-        base_confidence = 85
-        
-        # Adjust based on number of sources
-        if len(sources) > 3:
-            base_confidence += 5
-        if len(sources) > 5:
-            base_confidence += 5
-        
-        # Adjust based on execution time (longer research = more thorough)
-        if execution_time > 60:
-            base_confidence += 5
-        
-        # Adjust based on average credibility
-        avg_credibility = self._calculate_avg_credibility(sources)
-        if avg_credibility > 8.5:
-            base_confidence += 5
-        elif avg_credibility > 8.0:
-            base_confidence += 3
-        
-        return min(base_confidence, 95)  # Cap at 95%
+        if avg_credibility is None:
+            avg_credibility = self._calculate_avg_credibility(sources)
+        n = len(sources)
+        
+        # More sources, longer (more thorough) research and more credible
+        # sources each add to the base confidence of 85
+        confidence = (85
+                      + 5 * (n > 3) + 5 * (n > 5)
+                      + 5 * (execution_time > 60)
+                      + 5 * (avg_credibility > 8.5) + 3 * (8.0 < avg_credibility <= 8.5))
+        
+        return min(confidence, 95)  # Cap at 95%
     
     def get_memory_export(self) -> Dict[str, Any]:
         """Export the current memory state"""
@@ -451,9 +741,10 @@ class ResearchCrew:
         # For now, return current session data
         history = []
         
-        if self.memory.get_short_term('research_query'):
+        query = self.memory.get_short_term('research_query')
+        if query:
             history.append({
-                'query': self.memory.get_short_term('research_query'),
+                'query': query,
                 'timestamp': self.memory.get_short_term('start_time'),
                 'status': 'completed' if self.memory.get_short_term('research_results') else 'in_progress'
             })
@@ -4,7 +4,8 @@ Custom tool for analyzing and scoring academic sources
 """
 
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from itertools import chain
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from datetime import datetime
 from langchain.tools import tool
 from pydantic import BaseModel, Field
@@ -13,6 +14,62 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Metadata and findings patterns, compiled once for every analysis
+_AUTHOR_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"(?:Authors?:)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)",
+    r"(?:By|by)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
+    r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+et\s+al\.",
+    r"([A-Z]\.\s*[A-Z][a-z]+)",  # J. Smith format
+))
+_NAME_RE = re.compile(r'[A-Z][a-z]+')
+
+# Date formats in order of preference, each capturing the date in its only group
+_DATE_ALTERNATIVES = (
+    r"(?:published|posted|updated|date[d]?)\s*:?\s*(?P<slash>\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+    r"(?:published|posted|updated|date[d]?)\s*:?\s*(?P<word>\w+\s+\d{1,2},?\s+\d{4})",
+    r"(?P<iso>\d{4}[/-]\d{1,2}[/-]\d{1,2})",  # ISO format
+    r"(?:©|copyright)\s*(?P<cpy>\d{4})"  # Copyright year
+)
+# _DATE_RES[n] fuses the n + 1 most preferred formats into one alternation
+_DATE_RES = tuple(
+    re.compile('|'.join(_DATE_ALTERNATIVES[:n]), re.IGNORECASE)
+    for n in range(1, len(_DATE_ALTERNATIVES) + 1)
+)
+_YEAR_RE = re.compile(r'\d{4}')
+
+_FINDING_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r"(?:key\s+)?findings?:?\s*([^.]+\.)",
+    r"(?:main\s+)?results?:?\s*([^.]+\.)",
+    r"(?:in\s+)?conclusions?:?\s*([^.]+\.)",
+    r"the\s+study\s+(?:found|showed|demonstrated)\s+(?:that\s+)?([^.]+\.)",
+    r"our\s+(?:research|analysis)\s+(?:indicates|suggests|shows)\s+(?:that\s+)?([^.]+\.)"
+))
+_LIST_ITEM_RE = re.compile(r"(?:^|\n)\s*[•·▪▫◦‣⁃]\s*([^•·▪▫◦‣⁃\n]+)")
+
+# Citation markers: [1] or (Author, 2020)
+_CITATION_RE = re.compile(r"\[\d+\]|\(\w+,?\s+\d{4}\)")
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _tokenize(content_lower: str) -> FrozenSet[str]:
+    """Word tokens of a lowercased text, collected in one scan"""
+    return frozenset(_WORD_RE.findall(content_lower))
+
+
+def _find_whole_words(words: List[str], patterns: List[re.Pattern], text: str,
+                      tokens: FrozenSet[str]) -> List[str]:
+    """
+    Find which words occur in a lowercased text as whole words
+    
+    Single words are looked up among the text's tokens; phrases fall back
+    to their own word-boundary pattern.
+    """
+    return [
+        word for word, pattern in zip(words, patterns)
+        if (word in tokens if _WORD_RE.fullmatch(word) else pattern.search(text))
+    ]
+
 
 class SourceMetadata(BaseModel):
     """Schema for source metadata"""
@@ -68,6 +125,10 @@ class AcademicSourceAnalyzer:
         "evidence", "statistical", "empirical", "systematic"
     ]
     
+    # Leading characters scanned for bias and quality indicators; both
+    # signals saturate long before the end of a long document
+    SCAN_WINDOW = 20000
+    
     def __init__(self):
         """Initialize the analyzer"""
         self.compiled_patterns = self._compile_patterns()
@@ -83,61 +144,51 @@ class AcademicSourceAnalyzer:
             "quality": [re.compile(r"\b" + word + r"\b", re.IGNORECASE) for word in self.QUALITY_POSITIVE]
         }
     
-    def identify_source_type(self, url: str, content: str) -> Tuple[str, float]:
+    def identify_source_type(self, url: str, content: str,
+                             content_lower: Optional[str] = None) -> Tuple[str, float]:
         """
         Identify the type of source based on URL and content
         
+        Args:
+            url: Source URL
+            content: Source content
+            content_lower: Lowercased scan window of the content, if already computed
+        
         Returns:
             Tuple of (source_type, confidence)
         """
         url_lower = url.lower() if url else ""
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content[:1000].lower()
         combined_text = url_lower + " " + content_lower[:1000]  # Check first 1000 chars
         
-        scores = {
-            "academic": 0,
-            "news": 0,
-            "blog": 0,
-            "other": 0
-        }
+        # Count the indicators of each type that occur
+        academic, news, blog = (
+            sum(1 for pattern in self.compiled_patterns[category] if pattern.search(combined_text))
+            for category in ("academic", "news", "blog")
+        )
         
-        # Check patterns
-        for pattern in self.compiled_patterns["academic"]:
-            if pattern.search(combined_text):
-                scores["academic"] += 1
-                
-        for pattern in self.compiled_patterns["news"]:
-            if pattern.search(combined_text):
-                scores["news"] += 1
-                
-        for pattern in self.compiled_patterns["blog"]:
-            if pattern.search(combined_text):
-                scores["blog"] += 1
-        
-        # Determine source type
-        max_score = max(scores.values())
-        if max_score == 0:
+        # Determine source type; ties go to the earlier of academic, news, blog
+        total = academic + news + blog
+        if total == 0:
             return "other", 0.5
         
-        source_type = max(scores, key=scores.get)
-        confidence = scores[source_type] / sum(scores.values()) if sum(scores.values()) > 0 else 0
+        if academic >= news and academic >= blog:
+            source_type, best = "academic", academic
+        elif news >= blog:
+            source_type, best = "news", news
+        else:
+            source_type, best = "blog", blog
         
-        return source_type, confidence
+        return source_type, best / total
     
     def extract_authors(self, content: str) -> List[str]:
         """Extract author names from content"""
         authors = []
         
-        # Common author patterns - improved
-        author_patterns = [
-            r"(?:Authors?:)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)",
-            r"(?:By|by)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-            r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+et\s+al\.",
-            r"([A-Z]\.\s*[A-Z][a-z]+)",  # J. Smith format
-        ]
-        
-        for pattern in author_patterns:
-            matches = re.findall(pattern, content[:2000])  # Check beginning of content
+        head = content[:2000]  # Check beginning of content
+        for pattern in _AUTHOR_PATTERNS:
+            matches = pattern.findall(head)
             for match in matches:
                 # Split by comma if it's a list of authors
                 if ',' in match:
@@ -152,43 +203,46 @@ class AcademicSourceAnalyzer:
             # Filter out common false positives
             if (len(author) > 3 and 
                 not author.lower() in ['research', 'article', 'study', 'journal', 'university'] and
-                re.search(r'[A-Z][a-z]+', author)):
+                _NAME_RE.search(author)):
                 cleaned_authors.append(author)
         
-        return list(set(cleaned_authors))[:5]  # Return top 5 unique authors
+        return list(dict.fromkeys(cleaned_authors))[:5]  # Return the first 5 unique authors
     
     def extract_publication_date(self, content: str) -> Optional[str]:
         """Extract publication date from content"""
-        # Date patterns
-        date_patterns = [
-            r"(?:published|posted|updated|date[d]?)\s*:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-            r"(?:published|posted|updated|date[d]?)\s*:?\s*(\w+\s+\d{1,2},?\s+\d{4})",
-            r"(\d{4}[/-]\d{1,2}[/-]\d{1,2})",  # ISO format
-            r"(?:©|copyright)\s*(\d{4})"  # Copyright year
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return None
+        match = _DATE_RES[-1].search(content)
+        
+        # A more preferred format wins even if it occurs later; it cannot
+        # start at or before the match found, so only the rest is rescanned
+        while match and match.lastindex > 1:
+            preferred = _DATE_RES[match.lastindex - 2].search(content, match.start() + 1)
+            if not preferred:
+                break
+            match = preferred
+        
+        return match.group(match.lastindex) if match else None
     
-    def detect_bias_indicators(self, content: str) -> List[str]:
-        """Detect potential bias indicators in content"""
+    def detect_bias_indicators(self, content: str,
+                               content_lower: Optional[str] = None,
+                               tokens: Optional[FrozenSet[str]] = None) -> List[str]:
+        """Detect potential bias indicators in the scan window (its lowercased text and tokens are reused if given)"""
         bias_found = []
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content[:self.SCAN_WINDOW].lower()
         
-        for pattern in self.compiled_patterns["bias"]:
-            if pattern.search(content_lower):
-                bias_found.append(pattern.pattern.strip(r"\b"))
+        # Most texts contain none of the words even as substrings, which
+        # plain `in` checks rule out without tokenizing
+        if any(word in content_lower for word in self.BIAS_WORDS):
+            if tokens is None:
+                tokens = _tokenize(content_lower)
+            bias_found.extend(_find_whole_words(self.BIAS_WORDS, self.compiled_patterns["bias"], content_lower, tokens))
         
         # Check for one-sided language
-        if content_lower.count("however") < 1 and content_lower.count("although") < 1:
+        if "however" not in content_lower and "although" not in content_lower:
             if len(content) > 500:  # Only for substantial content
                 bias_found.append("lack of balanced perspective")
         
-        return list(set(bias_found))
+        return bias_found  # Each indicator is found at most once
     
     def calculate_credibility_score(self, source_type: str, type_confidence: float,
                                    authors: List[str], has_date: bool,
@@ -220,16 +274,20 @@ class AcademicSourceAnalyzer:
         return min(1.0, score)
     
     def calculate_quality_score(self, content: str, credibility_score: float,
-                               bias_indicators: List[str]) -> float:
-        """Calculate overall quality score"""
+                               bias_indicators: List[str],
+                               content_lower: Optional[str] = None,
+                               tokens: Optional[FrozenSet[str]] = None) -> float:
+        """Calculate overall quality score (the scan window's lowercased text and tokens are reused if given)"""
         score = 0.0
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content[:self.SCAN_WINDOW].lower()
+        if tokens is None:
+            tokens = _tokenize(content_lower)
         
         # Check for quality indicators (0.4 weight)
-        quality_count = 0
-        for pattern in self.compiled_patterns["quality"]:
-            if pattern.search(content_lower):
-                quality_count += 1
+        quality_count = len(
+            _find_whole_words(self.QUALITY_POSITIVE, self.compiled_patterns["quality"], content_lower, tokens)
+        )
         score += min(0.4, quality_count * 0.05)
         
         # Length and structure (0.2 weight)
@@ -249,34 +307,23 @@ class AcademicSourceAnalyzer:
     
     def extract_key_findings(self, content: str) -> List[str]:
         """Extract key findings or important points from content"""
-        findings = []
-        
-        # Look for sections with findings
-        finding_patterns = [
-            r"(?:key\s+)?findings?:?\s*([^.]+\.)",
-            r"(?:main\s+)?results?:?\s*([^.]+\.)",
-            r"(?:in\s+)?conclusions?:?\s*([^.]+\.)",
-            r"the\s+study\s+(?:found|showed|demonstrated)\s+(?:that\s+)?([^.]+\.)",
-            r"our\s+(?:research|analysis)\s+(?:indicates|suggests|shows)\s+(?:that\s+)?([^.]+\.)"
-        ]
-        
-        for pattern in finding_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-            findings.extend([match.strip() for match in matches])
+        # Look for sections with findings, then bullet points or numbered lists
+        matches = chain.from_iterable(
+            pattern.finditer(content) for pattern in (*_FINDING_PATTERNS, _LIST_ITEM_RE)
+        )
         
-        # Also look for bullet points or numbered lists
-        list_items = re.findall(r"(?:^|\n)\s*[•·▪▫◦‣⁃]\s*([^•·▪▫◦‣⁃\n]+)", content)
-        findings.extend([item.strip() for item in list_items if len(item.strip()) > 20])
-        
-        # Deduplicate and limit
+        # Deduplicate (keeping first occurrences), stopping once the limit is reached
         seen = set()
-        unique_findings = []
-        for finding in findings:
-            if finding not in seen and len(finding) > 20:
+        findings = []
+        for match in matches:
+            finding = match.group(1).strip()
+            if len(finding) > 20 and finding not in seen:
                 seen.add(finding)
-                unique_findings.append(finding)
+                findings.append(finding)
+                if len(findings) == 5:  # Return top 5 findings
+                    break
         
-        return unique_findings[:5]  # Return top 5 findings
+        return findings
     
     def generate_citation_data(self, metadata: SourceMetadata) -> Dict[str, Any]:
         """Generate citation data in various formats"""
@@ -284,10 +331,9 @@ class AcademicSourceAnalyzer:
         year = metadata.publication_date.split()[-1] if metadata.publication_date else "n.d."
         
         # Extract year from date if it's a full date
-        if metadata.publication_date and re.search(r'\d{4}', metadata.publication_date):
-            year_match = re.search(r'\d{4}', metadata.publication_date)
-            if year_match:
-                year = year_match.group()
+        year_match = _YEAR_RE.search(metadata.publication_date) if metadata.publication_date else None
+        if year_match:
+            year = year_match.group()
         
         citation_data = {
             "apa": f"{authors_str} ({year}). {metadata.title}.",
@@ -322,18 +368,22 @@ class AcademicSourceAnalyzer:
             AnalysisResult with all extracted information
         """
         try:
+            # Lowercased scan window and its word tokens, shared by the indicator checks
+            content_lower = content[:self.SCAN_WINDOW].lower()
+            tokens = _tokenize(content_lower)
+            
             # Identify source type
-            source_type, type_confidence = self.identify_source_type(url, content)
+            source_type, type_confidence = self.identify_source_type(url, content, content_lower)
             
             # Extract metadata
             authors = self.extract_authors(content)
             publication_date = self.extract_publication_date(content)
             
             # Count citations (simple pattern matching)
-            citations_count = len(re.findall(r"\[\d+\]|\(\w+,?\s+\d{4}\)", content))
+            citations_count = len(_CITATION_RE.findall(content))
             
             # Detect bias
-            bias_indicators = self.detect_bias_indicators(content)
+            bias_indicators = self.detect_bias_indicators(content, content_lower, tokens)
             
             # Create metadata
             metadata = SourceMetadata(
@@ -351,7 +401,9 @@ class AcademicSourceAnalyzer:
                 bool(publication_date), citations_count
             )
             
-            quality_score = self.calculate_quality_score(content, credibility_score, bias_indicators)
+            quality_score = self.calculate_quality_score(
+                content, credibility_score, bias_indicators, content_lower, tokens
+            )
             
             # Extract key findings
             key_findings = self.extract_key_findings(content)
@@ -373,6 +425,25 @@ class AcademicSourceAnalyzer:
             raise
 
 
+# Shared analyzer, created on first use; it keeps no per-analysis state
+_analyzer: Optional[AcademicSourceAnalyzer] = None
+
+
+def get_analyzer() -> AcademicSourceAnalyzer:
+    """
+    Get or create the shared academic source analyzer
+    
+    Returns:
+        AcademicSourceAnalyzer instance
+    """
+    global _analyzer
+    
+    if _analyzer is None:
+        _analyzer = AcademicSourceAnalyzer()
+    
+    return _analyzer
+
+
 @tool
 def analyze_academic_source(query: str) -> str:
     """
@@ -392,8 +463,7 @@ def analyze_academic_source(query: str) -> str:
         title = data.get('title', '')
         content = data.get('content', '')
         
-        analyzer = AcademicSourceAnalyzer()
-        result = analyzer.analyze(url, title, content)
+        result = get_analyzer().analyze(url, title, content)
         return result.model_dump_json(indent=2)
     except json.JSONDecodeError:
         return json.dumps({"error": "Invalid JSON input. Please provide a JSON string with 'url', 'title', and 'content' fields."})
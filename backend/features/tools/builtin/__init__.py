@@ -2,14 +2,95 @@
 Built-in Tools Module
 """
 
-from .serper_tool import SerperToolConfig
-from .website_search_tool import WebsiteSearchToolConfig
-from .file_read_tool import FileReadToolConfig
-from .scrape_website_tool import ScrapeWebsiteToolConfig
+from typing import Any, Dict, MutableMapping, Tuple
+import importlib
+import threading
+
+# Tool configs by name, with the module defining each; modules are imported
+# on first access (PEP 562) so unused tools cost nothing at import time
+_CONFIG_MODULES: Dict[str, str] = {
+    'SerperToolConfig': '.serper_tool',
+    'WebsiteSearchToolConfig': '.website_search_tool',
+    'FileReadToolConfig': '.file_read_tool',
+    'ScrapeWebsiteToolConfig': '.scrape_website_tool'
+}
+
+# Built tools by class and constructor arguments, shared by every config
+_tool_instances: Dict[Tuple[Any, ...], Any] = {}
+_tool_instances_lock = threading.Lock()
 
 __all__ = [
     'SerperToolConfig',
     'WebsiteSearchToolConfig',
     'FileReadToolConfig',
     'ScrapeWebsiteToolConfig'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool config class the first time it is referenced"""
+    if name not in _CONFIG_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(_CONFIG_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def load_tool_class(module_globals: MutableMapping[str, Any], name: str) -> Any:
+    """
+    Import a crewai_tools class into a tool config module on first use
+    
+    crewai_tools loads every bundled tool when imported, so the config
+    modules defer it until a tool is actually initialized. A value already
+    bound in the module (including a test patch) is returned as is.
+    
+    Args:
+        module_globals: globals() of the tool config module
+        name: Class name exported by crewai_tools
+        
+    Returns:
+        The tool class
+    """
+    tool_class = module_globals.get(name)
+    if tool_class is None:
+        tool_class = getattr(importlib.import_module('crewai_tools'), name)
+        module_globals[name] = tool_class
+    return tool_class
+
+
+def shared_tool(tool_class: Any, **kwargs: Any) -> Any:
+    """
+    Build a tool, or reuse the one already built from the same class and arguments
+    
+    Tools such as WebsiteSearchTool set up embedders and clients when built,
+    so configs (and tools managers) asking for the same tool share one.
+    
+    Args:
+        tool_class: Tool class to instantiate
+        **kwargs: Constructor arguments
+        
+    Returns:
+        The tool instance
+    """
+    key = (tool_class, tuple(sorted(kwargs.items())))
+    with _tool_instances_lock:
+        tool = _tool_instances.get(key)
+        if tool is None:
+            tool = _tool_instances[key] = tool_class(**kwargs)
+    return tool
+
+
+def clear_shared_tools(tool: Any = None) -> None:
+    """
+    Forget built tools so the next shared_tool call builds them again
+    
+    Args:
+        tool: Only forget this instance; forget every tool when omitted
+    """
+    with _tool_instances_lock:
+        if tool is None:
+            _tool_instances.clear()
+            return
+        for key in [key for key, value in _tool_instances.items() if value is tool]:
+            del _tool_instances[key]
@@ -2,13 +2,23 @@
 File Read Tool Configuration
 """
 
-from typing import Optional, Dict, Any
-from crewai_tools import FileReadTool
+from typing import Optional, Dict, Any, TYPE_CHECKING
+from . import load_tool_class, shared_tool
 import logging
 
+if TYPE_CHECKING:
+    from crewai_tools import FileReadTool
+
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve FileReadTool lazily; see load_tool_class"""
+    if name == 'FileReadTool':
+        return load_tool_class(globals(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class FileReadToolConfig:
     """Configuration and initialization for FileReadTool"""
     
@@ -23,7 +33,7 @@ class FileReadToolConfig:
         self.tool = None
         self._initialized = False
     
-    def initialize(self) -> Optional[FileReadTool]:
+    def initialize(self) -> Optional['FileReadTool']:
         """
         Initialize the FileReadTool
         
@@ -37,7 +47,7 @@ class FileReadToolConfig:
             # FileReadTool configuration options
             # You can add file type restrictions, size limits, etc.
             
-            self.tool = FileReadTool()
+            self.tool = shared_tool(load_tool_class(globals(), 'FileReadTool'))
             
             self._initialized = True
             logger.info("FileReadTool initialized successfully")
@@ -48,7 +58,7 @@ class FileReadToolConfig:
             logger.error(f"Failed to initialize FileReadTool: {str(e)}")
             return None
     
-    def get_tool(self) -> Optional[FileReadTool]:
+    def get_tool(self) -> Optional['FileReadTool']:
         """
         Get the initialized tool
         
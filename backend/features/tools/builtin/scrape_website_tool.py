@@ -2,13 +2,23 @@
 Scrape Website Tool Configuration
 """
 
-from typing import Optional, Dict, Any
-from crewai_tools import ScrapeWebsiteTool
+from typing import Optional, Dict, Any, TYPE_CHECKING
+from . import load_tool_class, shared_tool
 import logging
 
+if TYPE_CHECKING:
+    from crewai_tools import ScrapeWebsiteTool
+
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve ScrapeWebsiteTool lazily; see load_tool_class"""
+    if name == 'ScrapeWebsiteTool':
+        return load_tool_class(globals(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class ScrapeWebsiteToolConfig:
     """Configuration and initialization for ScrapeWebsiteTool"""
     
@@ -23,7 +33,7 @@ class ScrapeWebsiteToolConfig:
         self.tool = None
         self._initialized = False
     
-    def initialize(self) -> Optional[ScrapeWebsiteTool]:
+    def initialize(self) -> Optional['ScrapeWebsiteTool']:
         """
         Initialize the ScrapeWebsiteTool
         
@@ -37,7 +47,7 @@ class ScrapeWebsiteToolConfig:
             # ScrapeWebsiteTool configuration
             # Can add timeout, user agent, etc.
             
-            self.tool = ScrapeWebsiteTool()
+            self.tool = shared_tool(load_tool_class(globals(), 'ScrapeWebsiteTool'))
             
             self._initialized = True
             logger.info("ScrapeWebsiteTool initialized successfully")
@@ -48,7 +58,7 @@ class ScrapeWebsiteToolConfig:
             logger.error(f"Failed to initialize ScrapeWebsiteTool: {str(e)}")
             return None
     
-    def get_tool(self) -> Optional[ScrapeWebsiteTool]:
+    def get_tool(self) -> Optional['ScrapeWebsiteTool']:
         """
         Get the initialized tool
         
@@ -3,13 +3,23 @@ Serper Web Search Tool Configuration
 """
 
 import os
-from typing import Optional, Dict, Any
-from crewai_tools import SerperDevTool
+from typing import Optional, Dict, Any, TYPE_CHECKING
+from . import load_tool_class, shared_tool
 import logging
 
+if TYPE_CHECKING:
+    from crewai_tools import SerperDevTool
+
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve SerperDevTool lazily; see load_tool_class"""
+    if name == 'SerperDevTool':
+        return load_tool_class(globals(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class SerperToolConfig:
     """Configuration and initialization for SerperDevTool"""
     
@@ -24,7 +34,7 @@ class SerperToolConfig:
         self.tool = None
         self._initialized = False
     
-    def initialize(self) -> Optional[SerperDevTool]:
+    def initialize(self) -> Optional['SerperDevTool']:
         """
         Initialize the SerperDevTool
         
@@ -49,7 +59,8 @@ class SerperToolConfig:
             n_results = self.config.get('n_results', 10)
             
             # Initialize the tool
-            self.tool = SerperDevTool(
+            self.tool = shared_tool(
+                load_tool_class(globals(), 'SerperDevTool'),
                 api_key=api_key,
                 n_results=n_results
             )
@@ -63,7 +74,7 @@ class SerperToolConfig:
             logger.error(f"Failed to initialize SerperDevTool: {str(e)}")
             return None
     
-    def get_tool(self) -> Optional[SerperDevTool]:
+    def get_tool(self) -> Optional['SerperDevTool']:
         """
         Get the initialized tool
         
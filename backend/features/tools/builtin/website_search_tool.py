@@ -2,13 +2,23 @@
 Website Search Tool Configuration
 """
 
-from typing import Optional, Dict, Any
-from crewai_tools import WebsiteSearchTool
+from typing import Optional, Dict, Any, TYPE_CHECKING
+from . import load_tool_class, shared_tool
 import logging
 
+if TYPE_CHECKING:
+    from crewai_tools import WebsiteSearchTool
+
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve WebsiteSearchTool lazily; see load_tool_class"""
+    if name == 'WebsiteSearchTool':
+        return load_tool_class(globals(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class WebsiteSearchToolConfig:
     """Configuration and initialization for WebsiteSearchTool"""
     
@@ -23,7 +33,7 @@ class WebsiteSearchToolConfig:
         self.tool = None
         self._initialized = False
     
-    def initialize(self) -> Optional[WebsiteSearchTool]:
+    def initialize(self) -> Optional['WebsiteSearchTool']:
         """
         Initialize the WebsiteSearchTool
         
@@ -37,7 +47,7 @@ class WebsiteSearchToolConfig:
             # WebsiteSearchTool doesn't require API keys
             # You can add custom configuration here if needed
             
-            self.tool = WebsiteSearchTool()
+            self.tool = shared_tool(load_tool_class(globals(), 'WebsiteSearchTool'))
             
             self._initialized = True
             logger.info("WebsiteSearchTool initialized successfully")
@@ -48,7 +58,7 @@ class WebsiteSearchToolConfig:
             logger.error(f"Failed to initialize WebsiteSearchTool: {str(e)}")
             return None
     
-    def get_tool(self) -> Optional[WebsiteSearchTool]:
+    def get_tool(self) -> Optional['WebsiteSearchTool']:
         """
         Get the initialized tool
         
@@ -8,12 +8,31 @@ from .builtin import (
     SerperToolConfig,
     WebsiteSearchToolConfig,
     FileReadToolConfig,
-    ScrapeWebsiteToolConfig
+    ScrapeWebsiteToolConfig,
+    clear_shared_tools
 )
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Tool names available to each agent role
+_ROLE_TOOL_MAPPING: Dict[str, tuple] = {
+    'information_gatherer': (
+        'serper',
+        'website_search',
+        'scrape_website',
+        'academic_analyzer'
+    ),
+    'data_analyst': (
+        'file_read',
+        'academic_analyzer'
+    ),
+    'content_synthesizer': (
+        'file_read',
+    ),
+    'research_coordinator': ()  # Coordinator doesn't need tools directly
+}
+
 
 class ToolsManager:
     """Centralized manager for all tools"""
@@ -29,6 +48,7 @@ class ToolsManager:
         self._builtin_configs = {}
         self._builtin_tools = {}
         self._custom_tools = {}
+        self._agent_tools: Dict[str, tuple] = {}
         self._initialize_builtin_tools()
         self._initialize_custom_tools()
     
@@ -127,37 +147,21 @@ class ToolsManager:
         Returns:
             List of tools appropriate for the agent
         """
-        # Define tool mappings for different agent roles
-        role_tool_mapping = {
-            'information_gatherer': [
-                'serper', 
-                'website_search', 
-                'scrape_website',
-                'academic_analyzer'
-            ],
-            'data_analyst': [
-                'file_read',
-                'academic_analyzer'
-            ],
-            'content_synthesizer': [
-                'file_read'
-            ],
-            'research_coordinator': []  # Coordinator doesn't need tools directly
-        }
-        
-        # Get tool names for the role
-        tool_names = role_tool_mapping.get(agent_role.lower(), [])
+        role = agent_role.lower()
         
-        # Return the actual tool instances
-        tools = []
-        for name in tool_names:
-            tool = self.get_tool(name)
-            if tool:
-                tools.append(tool)
-            else:
-                logger.warning(f"Tool '{name}' not available for agent role '{agent_role}'")
+        # Tool sets are resolved once per role; every agent instance shares them
+        tools = self._agent_tools.get(role)
+        if tools is None:
+            resolved = []
+            for name in _ROLE_TOOL_MAPPING.get(role, ()):
+                tool = self.get_tool(name)
+                if tool:
+                    resolved.append(tool)
+                else:
+                    logger.warning(f"Tool '{name}' not available for agent role '{agent_role}'")
+            tools = self._agent_tools[role] = tuple(resolved)
         
-        return tools
+        return list(tools)
     
     def get_tools_status(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -251,10 +255,15 @@ class ToolsManager:
             True if successful, False otherwise
         """
         if tool_name in self._builtin_configs:
+            # Drop the built tool and its config so initialize() builds a new one
             config = self._builtin_configs[tool_name]
+            if config.tool is not None:
+                clear_shared_tools(config.tool)
+            config = self._builtin_configs[tool_name] = type(config)(config.config)
             tool = config.initialize()
             if tool:
                 self._builtin_tools[tool_name] = tool
+                self._agent_tools.clear()
                 logger.info(f"Successfully reloaded tool: {tool_name}")
                 return True
             else:
@@ -290,4 +299,5 @@ def get_tools_manager(config: Optional[Dict[str, Any]] = None) -> ToolsManager:
 def reset_tools_manager() -> None:
     """Reset the tools manager singleton (mainly for testing)"""
     global _tools_manager
-    _tools_manager = None
\ No newline at end of file
+    _tools_manager = None
+    clear_shared_tools()
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+Utils Module
+Shared helpers used across agents
+"""
+
+from .keywords import KeywordMatcher
+
+__all__ = [
+    'KeywordMatcher'
+]
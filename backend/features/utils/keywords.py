@@ -0,0 +1,46 @@
+"""
+Keyword Matching
+Finds which of a fixed set of keywords occur in a text with a single scan
+"""
+
+from typing import Iterable, FrozenSet
+import re
+
+
+class KeywordMatcher:
+    """Multi-keyword substring matcher compiled once and reused for every text"""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile the matcher
+
+        Args:
+            keywords: Literal keywords to look for (matched case-sensitively)
+        """
+        self.keywords = frozenset(keywords)
+
+        # Longest first so a keyword never hides a longer one starting at the
+        # same position; the lookahead lets matches overlap like `in` checks
+        alternation = '|'.join(re.escape(k) for k in sorted(self.keywords, key=len, reverse=True))
+        self._pattern = re.compile(f'(?=({alternation}))')
+
+        # Shorter keywords that are prefixes of a longer one match with it
+        self._implied = {
+            keyword: frozenset(k for k in self.keywords if keyword.startswith(k))
+            for keyword in self.keywords
+        }
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """
+        Find the keywords contained in a text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of keywords that occur in the text
+        """
+        found = set()
+        for match in self._pattern.finditer(text):
+            found.update(self._implied[match.group(1)])
+        return frozenset(found)
@@ -8,16 +8,26 @@ import sys
 import time
 import os
 from multiprocessing import Process
+from dotenv import load_dotenv
+
+# Load environment variables (the launch settings below come from .env too)
+load_dotenv()
 
 def run_backend_sync():
     """Run the synchronous FastAPI backend"""
     os.chdir("backend/api")
+    
+    # Same settings as backend/api/main.py: reload is for development only,
+    # and more than one process splits the API's in-memory state between them
+    reload = os.getenv("API_RELOAD", "False").lower() == "true"
+    processes = int(os.getenv("API_PROCESSES", "1"))
+    
     subprocess.run([
         sys.executable, "-m", "uvicorn", 
         "main:app", 
         "--host", "0.0.0.0", 
         "--port", "8000", 
-        "--reload"
+        *(["--reload"] if reload else ["--workers", str(processes)])
     ])
 
 def run_frontend_sync():
@@ -0,0 +1,46 @@
+"""
+Optional build script for compiled agent modules
+
+The project runs as plain Python; this only compiles the hot heuristic
+modules (the analyst's scoring, the coordinator's query planning and the
+keyword matcher) with Cython:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+Each resulting extension sits next to its .py file and is imported in its
+place. Delete the generated .so/.pyd files to go back to pure Python.
+Without Cython installed nothing is compiled and the modules stay plain
+Python.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+COMPILED_MODULES = [
+    "backend/features/agents/analyst.py",
+    "backend/features/agents/coordinator.py",
+    "backend/features/utils/keywords.py",
+]
+
+if cythonize is not None:
+    ext_modules = cythonize(
+        COMPILED_MODULES,
+        compiler_directives={
+            "language_level": 3,
+            "infer_types": True,
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    )
+else:
+    ext_modules = []
+
+setup(
+    name="research-assistant-extensions",
+    ext_modules=ext_modules,
+)
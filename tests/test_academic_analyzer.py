@@ -14,7 +14,8 @@ from backend.features.tools.academic_analyzer import (
     AcademicSourceAnalyzer, 
     SourceMetadata, 
     AnalysisResult,
-    analyze_academic_source
+    analyze_academic_source,
+    get_analyzer
 )
 
 
@@ -114,6 +115,12 @@ class TestAcademicSourceAnalyzer:
         assert "bias" in analyzer.compiled_patterns
         assert len(analyzer.compiled_patterns) > 0
     
+    def test_get_analyzer_is_shared(self):
+        """Test that the tool reuses one analyzer"""
+        analyzer = get_analyzer()
+        assert isinstance(analyzer, AcademicSourceAnalyzer)
+        assert get_analyzer() is analyzer
+    
     def test_identify_source_type_academic(self, analyzer, academic_content):
         """Test identifying academic sources"""
         source_type, confidence = analyzer.identify_source_type(
@@ -149,6 +156,9 @@ class TestAcademicSourceAnalyzer:
         # Check that we found at least one of the authors
         author_names = ' '.join(authors).lower()
         assert any(name in author_names for name in ['jane', 'john', 'emily', 'anderson'])
+        
+        # Authors keep the order they were found in
+        assert analyzer.extract_authors("Authors: John Smith, Jane Doe, John Smith") == ["John Smith", "Jane Doe"]
     
     def test_extract_publication_date(self, analyzer):
         """Test date extraction with various formats"""
@@ -157,7 +167,10 @@ class TestAcademicSourceAnalyzer:
             ("Published: March 15, 2024", "March 15, 2024"),
             ("Date: 03/15/2024", "03/15/2024"),
             ("Updated: 2024-03-15", "2024-03-15"),
-            ("© 2024 Company", "2024")
+            ("© 2024 Company", "2024"),
+            # Preferred formats win even when they come later
+            ("© 2020 Company. Released 2021-01-05. Published: 03/15/2024", "03/15/2024"),
+            ("© 2020-01-05", "2020-01-05")
         ]
         
         for content, expected in test_cases:
@@ -175,6 +188,18 @@ class TestAcademicSourceAnalyzer:
         academic_bias = analyzer.detect_bias_indicators(academic_content)
         assert len(academic_bias) < len(blog_bias)
     
+    def test_indicator_scan_window(self, analyzer):
+        """Test that bias and quality indicators are only looked for near the start"""
+        padding = "x " * analyzer.SCAN_WINDOW
+        assert "obviously" in analyzer.detect_bias_indicators("obviously " + padding)
+        assert "obviously" not in analyzer.detect_bias_indicators(padding + "obviously")
+        
+        scores = [
+            analyzer.calculate_quality_score(text, 0.5, [])
+            for text in ("methodology results " + padding, padding + "methodology results")
+        ]
+        assert scores[0] > scores[1]
+    
     def test_calculate_credibility_score(self, analyzer):
         """Test credibility score calculation"""
         # High credibility
@@ -203,6 +228,12 @@ class TestAcademicSourceAnalyzer:
         assert len(findings) > 0
         assert any("95% accuracy" in finding for finding in findings)
         assert any("40%" in finding for finding in findings)
+        
+        # Repeated findings are kept once, and at most five are returned
+        content = " ".join(f"Findings: result number {i} holds for every input." for i in (1, 1, 2, 3, 4, 5, 6, 7))
+        assert analyzer.extract_key_findings(content) == [
+            f"result number {i} holds for every input." for i in range(1, 6)
+        ]
     
     def test_generate_citation_data(self, analyzer):
         """Test citation generation"""
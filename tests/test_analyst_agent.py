@@ -159,6 +159,13 @@ class TestDataAnalystAgent:
         assert analyst._categorize_source('https://nytimes.com/article') == 'news'
         assert analyst._categorize_source('https://example.com') == 'other'
     
+    def test_categorize_source_uses_hostname(self, analyst):
+        """Test that only the hostname decides the category"""
+        assert analyst._categorize_source('https://WWW.MIT.EDU/paper') == 'academic'
+        assert analyst._categorize_source('example.gov/report') == 'government'
+        assert analyst._categorize_source('https://example.com/news/story') == 'other'
+        assert analyst._categorize_source('https://example.com/file.edu') == 'other'
+    
     def test_find_contradictions(self, analyst):
         """Test contradiction detection"""
         findings = [
@@ -10,7 +10,7 @@ from unittest.mock import MagicMock, patch
 # Add the backend directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from backend.features.agents.coordinator import ResearchCoordinatorAgent
+from backend.features.agents.coordinator import ResearchCoordinatorAgent, SubTaskBatch
 from backend.features.memory.research_memory import ResearchMemory
 
 
@@ -39,6 +39,14 @@ class TestResearchCoordinatorAgent:
         assert agent.allow_delegation is True
         # Memory is enabled during creation but not accessible as an attribute
     
+    def test_agent_created_lazily(self, memory):
+        """Test that the CrewAI agent is only built on first use"""
+        coordinator = ResearchCoordinatorAgent(memory)
+        assert 'agent' not in coordinator.__dict__
+        
+        agent = coordinator.get_agent()
+        assert coordinator.get_agent() is agent
+    
     def test_plan_research_simple_query(self, coordinator):
         """Test research planning for simple query"""
         query = "What is machine learning?"
@@ -98,6 +106,17 @@ class TestResearchCoordinatorAgent:
             for expected in expected_objectives:
                 assert expected in objectives
     
+    def test_identify_objectives_cached_copy(self, coordinator):
+        """Test that memoized objectives are returned as fresh lists"""
+        objectives = coordinator._identify_objectives("What is AI?")
+        objectives.append("Mutated")
+        
+        assert "Mutated" not in coordinator._identify_objectives("What is AI?")
+        
+        coordinator.clear_cache()
+        assert coordinator._identify_objectives("What is AI?") == ["Identify and explain key concepts"]
+        assert coordinator.get_research_objectives("What is AI?") == ("Identify and explain key concepts",)
+    
     def test_create_sub_tasks(self, coordinator):
         """Test sub-task creation"""
         objectives = [
@@ -123,6 +142,38 @@ class TestResearchCoordinatorAgent:
         synthesis_tasks = [t for t in sub_tasks if t['type'] == 'synthesis']
         assert len(synthesis_tasks) >= 1
     
+    def test_create_sub_tasks_custom_rules(self, memory):
+        """Test sub-task rules supplied through config"""
+        config = {
+            'sub_task_rules': [{
+                'triggers': ['trend'],
+                'id_suffix': 'forecast',
+                'type': 'analysis',
+                'description': "Forecast trends for: {objective}",
+                'agent': 'data_analyst'
+            }]
+        }
+        coordinator = ResearchCoordinatorAgent(memory, config)
+        
+        sub_tasks = coordinator._create_sub_tasks(["Identify future trends and projections"])
+        
+        assert [t['id'] for t in sub_tasks] == ['task_0_forecast', 'task_0_synthesize']
+        assert sub_tasks[0]['description'] == "Forecast trends for: Identify future trends and projections"
+        assert coordinator._prioritize_tasks(sub_tasks) == ['task_0_forecast', 'task_0_synthesize']
+    
+    def test_sub_task_batch(self, coordinator):
+        """Test that the columnar batch matches the sub-task dicts"""
+        objectives = ["Identify and explain key concepts", "Compare and contrast different aspects"]
+        batch = coordinator._create_sub_task_batch(objectives)
+        
+        assert isinstance(batch, SubTaskBatch)
+        assert batch.to_dicts() == coordinator._create_sub_tasks(objectives)
+        assert len(batch) == 3
+        
+        # Batch and dict forms prioritize identically
+        assert coordinator._prioritize_tasks(batch) == coordinator._prioritize_tasks(batch.to_dicts())
+        assert coordinator._identify_required_agents(batch) == ['information_gatherer', 'data_analyst', 'content_synthesizer']
+    
     def test_identify_required_agents(self, coordinator):
         """Test required agent identification"""
         sub_tasks = [
@@ -138,6 +189,9 @@ class TestResearchCoordinatorAgent:
         assert 'information_gatherer' in required
         assert 'data_analyst' in required
         assert 'content_synthesizer' in required
+        
+        # Order of first use is preserved
+        assert required == ['information_gatherer', 'data_analyst', 'content_synthesizer']
     
     def test_prioritize_tasks(self, coordinator):
         """Test task prioritization"""
@@ -205,6 +259,21 @@ class TestResearchCoordinatorAgent:
         assert shared['action'] == 'delegated'
         assert shared['to'] == 'information_gatherer'
     
+    def test_agent_callback_event_history(self, coordinator):
+        """Test that buffered events are flushed on task completion"""
+        coordinator._agent_callback({'type': 'thinking'})
+        coordinator._agent_callback({'type': 'task_started', 'task': 'A'})
+        coordinator._agent_callback({'type': 'task_started', 'task': 'B'})
+        
+        # Nothing flushed until a task completes
+        assert coordinator.memory.get_short_term('coordinator_event_history') is None
+        
+        coordinator._agent_callback({'type': 'task_completed', 'task': 'B'})
+        
+        history = coordinator.memory.get_short_term('coordinator_event_history')
+        assert [e['type'] for e in history] == ['thinking', 'task_started', 'task_started', 'task_completed']
+        assert coordinator.memory.get_short_term('coordinator_event_task_started')['task'] == 'B'
+    
     def test_configuration(self):
         """Test agent configuration options"""
         memory = ResearchMemory()
@@ -105,6 +105,16 @@ class TestInformationGathererAgent:
         queries = gatherer._create_search_queries(quoted_query)
         assert quoted_query in queries
     
+    def test_create_search_queries_cached_copy(self, gatherer):
+        """Test that memoized queries are returned as fresh lists"""
+        queries = gatherer._create_search_queries("climate change")
+        queries.clear()
+        
+        assert "climate change" in gatherer._create_search_queries("climate change")
+        
+        gatherer.clear_cache()
+        assert "climate change" in gatherer._create_search_queries("climate change")
+    
     def test_is_reliable_source(self, gatherer):
         """Test source reliability checking"""
         # Academic source
@@ -165,6 +175,22 @@ class TestInformationGathererAgent:
         # Academic source should rank high
         assert evaluated[0]['source']['type'] in ['academic', 'government']
     
+    def test_evaluate_sources_parallel_scoring(self, memory):
+        """Test that parallel scoring ranks sources like sequential scoring"""
+        sources = [
+            {'url': f'https://site{i}.{"edu" if i % 3 == 0 else "com"}', 'date': str(2020 + i % 6),
+             'relevance_score': (i % 7) / 7}
+            for i in range(20)
+        ]
+        
+        sequential = InformationGathererAgent(memory).evaluate_sources(sources)
+        
+        parallel_gatherer = InformationGathererAgent(memory, {'parallel_scoring': True, 'max_workers': 4})
+        parallel = parallel_gatherer.evaluate_sources(sources)
+        parallel_gatherer.close()
+        
+        assert parallel == sequential
+    
     def test_calculate_reliability_score(self, gatherer):
         """Test reliability score calculation"""
         # .edu domain
@@ -189,17 +215,27 @@ class TestInformationGathererAgent:
     
     def test_calculate_recency_score(self, gatherer):
         """Test recency score calculation"""
+        import datetime
+        current_year = datetime.datetime.now().year
+        
         # Current year
-        current = {'date': 'January 2025'}
+        current = {'date': f'January {current_year}'}
         assert gatherer._calculate_recency_score(current) == 1.0
         
         # Last year
-        last_year = {'date': 'December 2024'}
+        last_year = {'date': f'December {current_year - 1}'}
         assert gatherer._calculate_recency_score(last_year) == 0.9
         
         # Old content
         old = {'date': '2020'}
         assert gatherer._calculate_recency_score(old) < 0.5
+        
+        # Undated content
+        assert gatherer._calculate_recency_score({}) == 0.3
+        
+        # The most recent year mentioned wins
+        updated = {'date': f'2019, updated {current_year}'}
+        assert gatherer._calculate_recency_score(updated) == 1.0
     
     def test_extract_key_information(self, gatherer):
         """Test key information extraction"""
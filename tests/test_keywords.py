@@ -0,0 +1,45 @@
+"""
+Tests for Keyword Matcher
+"""
+
+import pytest
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.features.utils.keywords import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher class"""
+    
+    @pytest.fixture
+    def matcher(self):
+        """Create a matcher with overlapping keywords"""
+        return KeywordMatcher(['how', 'how to', 'why', 'news', 'new', 'in-depth'])
+    
+    def test_find_keywords(self, matcher):
+        """Test that contained keywords are found"""
+        assert matcher.find("why does this matter") == {'why'}
+        assert matcher.find("an in-depth look") == {'in-depth'}
+        assert matcher.find("nothing here") == set()
+    
+    def test_find_matches_substrings(self, matcher):
+        """Test that matching behaves like substring checks"""
+        assert matcher.find("somehow") == {'how'}
+        assert matcher.find("latest newsletter") == {'new', 'news'}
+    
+    def test_find_overlapping_keywords(self, matcher):
+        """Test keywords that overlap or share a prefix"""
+        assert matcher.find("how to cook") == {'how', 'how to'}
+        assert matcher.find("showhy") == {'how', 'why'}
+    
+    def test_find_is_case_sensitive(self, matcher):
+        """Test that callers are expected to lowercase text"""
+        assert matcher.find("HOW") == set()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -104,6 +104,24 @@ class TestResearchMemory:
         # Test non-existent agent
         assert memory.get_shared_data("non_existent") is None
     
+    def test_batch_write(self, memory):
+        """Test applying several writes in one batch"""
+        memory.batch_write([
+            ("short_term", "plan", {"steps": 3}),
+            ("short_term", "query", "AI", {"source": "user"}),
+            ("long_term", "reliable_sources", "https://example.edu"),
+            ("shared", "agent1", {"status": "done"}, "high")
+        ])
+        
+        assert memory.get_short_term("plan") == {"steps": 3}
+        assert memory.short_term["query"]["metadata"] == {"source": "user"}
+        assert memory.short_term["plan"]["timestamp"] == memory.shared_data["agent1"]["timestamp"]
+        assert "https://example.edu" in memory.get_long_term("reliable_sources")
+        assert memory.get_all_shared_data(priority="high") == {"agent1": {"status": "done"}}
+        
+        with pytest.raises(ValueError):
+            memory.batch_write([("unknown", "key", "value")])
+    
     def test_get_all_shared_data(self, memory):
         """Test retrieving all shared data with filters"""
         # Share data with different priorities
@@ -123,6 +141,25 @@ class TestResearchMemory:
         assert "agent3" in high_priority
         assert "agent2" not in high_priority
     
+    def test_get_shared_sources(self, memory):
+        """Test shared source records are indexed as they are shared"""
+        memory.share_data("agent1", {"url": "https://a.edu", "title": "A"})
+        memory.share_data("agent2", [{"title": "B"}, {"status": "done"}, "text"])
+        memory.batch_write([("shared", "agent3", {"status": "done"})])
+        assert memory.get_shared_sources() == [{"url": "https://a.edu", "title": "A"}, {"title": "B"}]
+        
+        # Overwriting keeps the agent's position; clearing drops its sources
+        memory.share_data("agent1", {"title": "C"})
+        memory.share_data("agent3", {"url": "https://d.gov"})
+        memory.clear_shared_data("agent2")
+        assert memory.get_shared_sources() == [{"title": "C"}, {"url": "https://d.gov"}]
+        
+        exported = memory.export_memory()
+        memory.clear_shared_data()
+        assert memory.get_shared_sources() == []
+        memory.import_memory(exported)
+        assert memory.get_shared_sources() == [{"title": "C"}, {"url": "https://d.gov"}]
+    
     def test_clear_operations(self, memory):
         """Test memory clearing operations"""
         # Add data
@@ -162,6 +199,32 @@ class TestResearchMemory:
         assert "key2" in stats["memory_breakdown"]["short_term"]
         assert "agent1" in stats["memory_breakdown"]["shared_agents"]
     
+    def test_snapshots_follow_writes(self, memory):
+        """Test that cached stats and exports are refreshed after writes"""
+        memory.store_short_term("key1", "value1")
+        first = memory.export_memory()
+        
+        # Exports are independent copies of memory
+        first["short_term"]["key1"]["value"] = "changed"
+        first["long_term"]["extra"] = {}
+        assert memory.export_memory()["short_term"]["key1"]["value"] == "value1"
+        assert "extra" not in memory.export_memory()["long_term"]
+        assert memory.get_short_term("key1") == "value1"
+        assert memory.get_memory_stats()["short_term_items"] == 1
+        
+        memory.share_data("agent1", "data1")
+        exported = memory.export_memory()
+        assert "agent1" in exported["shared_data"]
+        assert memory.get_memory_stats()["shared_data_agents"] == 1
+        
+        # Reads that bump access counts are reflected too
+        memory.get_shared_data("agent1")
+        assert memory.export_memory()["shared_data"]["agent1"]["accessed_count"] == 1
+        
+        memory.clear_short_term()
+        assert memory.export_memory()["short_term"] == {}
+        assert memory.get_memory_stats()["short_term_items"] == 0
+    
     def test_export_import_memory(self, memory):
         """Test memory export and import"""
         # Add data
@@ -184,6 +247,38 @@ class TestResearchMemory:
         assert new_memory.get_short_term("key1") == "value1"
         assert "source1" in new_memory.get_long_term("reliable_sources")
         assert new_memory.get_shared_data("agent1") == "data1"
+        
+        # Timestamps are exported as ISO strings and restored as epoch nanoseconds
+        datetime.fromisoformat(exported["short_term"]["key1"]["timestamp"])
+        restored = new_memory.short_term["key1"]["timestamp"]
+        assert abs(restored - memory.short_term["key1"]["timestamp"]) < 1000
+        assert new_memory.export_memory()["short_term"]["key1"] == exported["short_term"]["key1"]
+    
+    def test_save_load_memory(self, memory, tmp_path):
+        """Test persisting memory to SQLite and loading it back"""
+        path = str(tmp_path / "memory.db")
+        memory.store_short_term("key1", {"nested": [1, 2]}, {"source": "test"})
+        memory.store_long_term("reliable_sources", "source1", "append")
+        memory.share_data("agent1", "data1", "high")
+        memory.save(path)
+        
+        # A second save replaces the snapshot instead of merging into it
+        memory.store_short_term("key2", "value2")
+        memory.save(path)
+        
+        new_memory = ResearchMemory()
+        new_memory.load(path)
+        assert new_memory.get_short_term("key1") == {"nested": [1, 2]}
+        assert new_memory.short_term["key1"]["metadata"] == {"source": "test"}
+        assert new_memory.get_short_term("key2") == "value2"
+        assert "source1" in new_memory.get_long_term("reliable_sources")
+        assert new_memory.get_all_shared_data(priority="high") == {"agent1": "data1"}
+        assert new_memory.short_term["key1"]["timestamp"] == memory.short_term["key1"]["timestamp"]
+        
+        memory.clear_short_term()
+        memory.save(path)
+        new_memory.load(path)
+        assert new_memory.short_term == {}
     
     def test_new_category_creation(self, memory):
         """Test automatic creation of new long-term categories"""
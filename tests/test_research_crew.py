@@ -5,6 +5,8 @@ Tests for Research Crew Orchestration
 import pytest
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 from dotenv import load_dotenv
 
@@ -14,6 +16,7 @@ load_dotenv()
 # Add the backend directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+from crewai import CrewOutput
 from backend.features.orchestration.research_crew import ResearchCrew
 
 
@@ -75,6 +78,24 @@ class TestResearchCrew:
         for task in tasks:
             assert query in task.description
     
+    def test_create_parallel_gathering_tasks(self, crew):
+        """Test one concurrent gathering task per objective"""
+        crew.config['parallel_gathering'] = True
+        query = "What is AI and how does it work?"
+        tasks = crew.create_research_tasks(query)
+        
+        planning, gathering, analysis, synthesis = tasks[0], tasks[1:-2], tasks[-2], tasks[-1]
+        assert len(gathering) == 2
+        assert all(task.async_execution for task in gathering)
+        assert all(task.context == [planning] for task in gathering)
+        assert "Identify and explain key concepts" in gathering[0].description
+        assert analysis.context == gathering
+        assert synthesis.context == [planning, *gathering, analysis]
+        assert not analysis.async_execution
+        
+        # Single-objective queries keep one sequential gathering task
+        assert len(crew.create_research_tasks("Explain AI")) == 4
+    
     @patch('backend.features.orchestration.research_crew.Crew')
     def test_execute_research_success(self, mock_crew_class, crew):
         """Test successful research execution"""
@@ -109,6 +130,116 @@ class TestResearchCrew:
         assert crew.memory.get_short_term('research_query') == query
         assert crew.memory.get_short_term('start_time') is not None
     
+    @patch('backend.features.orchestration.research_crew.Crew')
+    def test_execute_research_cached(self, mock_crew_class, crew):
+        """Test that repeated queries are served from the query cache"""
+        mock_crew_instance = MagicMock()
+        mock_crew_instance.kickoff.return_value = "Research completed"
+        mock_crew_class.return_value = mock_crew_instance
+        
+        first = crew.execute_research("What is AI?")
+        second = crew.execute_research("  what is   AI ")
+        
+        assert second['success'] is True
+        assert second['cached'] is True
+        assert second['query'] == "  what is   AI "
+        assert second['report'] == first['report']
+        mock_crew_instance.kickoff.assert_called_once()
+        
+        # Each hit gets its own copy of the cached response
+        second['report']['executive_summary'] = "Changed"
+        second['sources'].clear()
+        third = crew.execute_research("What is AI?")
+        assert third['report'] == first['report']
+        assert third['sources'] == first['sources']
+        assert 'cached' not in first
+        
+        # A different query or a cleared cache runs the crew again
+        crew.execute_research("What is ML?")
+        crew.clear_query_cache()
+        crew.execute_research("What is AI?")
+        assert mock_crew_instance.kickoff.call_count == 3
+    
+    @patch('backend.features.orchestration.research_crew.Crew')
+    def test_execute_research_shared_cache(self, mock_crew_class, crew):
+        """Test that responses are shared between crews through the shared cache"""
+        store = {}
+        shared_cache = MagicMock()
+        shared_cache.get.side_effect = store.get
+        shared_cache.set.side_effect = lambda key, value, ex: store.__setitem__(key, value)
+        mock_crew_instance = MagicMock()
+        mock_crew_instance.kickoff.return_value = "Research completed"
+        mock_crew_class.return_value = mock_crew_instance
+        
+        other = ResearchCrew(dict(crew.config))
+        crew._shared_cache = other._shared_cache = shared_cache
+        first = crew.execute_research("What is AI?")
+        second = other.execute_research("what is AI")
+        
+        mock_crew_instance.kickoff.assert_called_once()
+        assert second['report'] == first['report']
+        assert shared_cache.set.call_args[1]['ex'] == 24 * 3600
+        
+        # Crews configured differently don't share responses
+        different = ResearchCrew({**crew.config, 'agents': {'analyst': {'model': 'other'}}, 'cache_ttl': 60})
+        different._shared_cache = shared_cache
+        different.execute_research("What is AI?")
+        assert mock_crew_instance.kickoff.call_count == 2
+        assert shared_cache.set.call_args[1]['ex'] == 60
+        
+        # Without a server-side URL no shared cache is used, whatever the config says
+        assert ResearchCrew({'verbose': False})._get_shared_cache() is None
+        assert ResearchCrew({'query_cache_url': 'redis://elsewhere:6379'})._get_shared_cache() is None
+        
+        # Invalid cache settings fall back to the defaults instead of failing the run
+        invalid = ResearchCrew({**crew.config, 'cache_ttl': 'soon', 'query_cache_size': None})
+        invalid._shared_cache = shared_cache
+        result = invalid.execute_research("What is ML?")
+        assert result['success'] is True
+        assert shared_cache.set.call_args[1]['ex'] == 24 * 3600
+        assert invalid.execute_research("what is ML")['cached'] is True
+    
+    @patch('backend.features.orchestration.research_crew.Crew')
+    def test_execute_research_concurrent(self, mock_crew_class, crew):
+        """Test that concurrent runs on one crew don't overlap or repeat a cached query"""
+        running = []
+        overlapped = []
+        
+        def kickoff():
+            running.append(True)
+            overlapped.append(len(running) > 1)
+            time.sleep(0.05)
+            running.pop()
+            return "Research completed"
+        
+        mock_crew_class.return_value.kickoff.side_effect = kickoff
+        
+        queries = ["What is AI?", "What is ML?", "what is AI"]
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(pool.map(crew.execute_research, queries))
+        
+        assert [r['query'] for r in results] == queries
+        assert all(r['success'] for r in results)
+        assert overlapped == [False, False]
+    
+    @patch('backend.features.orchestration.research_crew.Crew')
+    def test_execute_research_overlapped_postprocessing(self, mock_crew_class, crew):
+        """Test that sources extracted on the worker thread match the inline path"""
+        mock_crew_instance = MagicMock()
+        mock_crew_instance.kickoff.return_value = "## Executive Summary\nAI is useful."
+        mock_crew_class.return_value = mock_crew_instance
+        crew.memory.share_data('information_gatherer', [{'title': 'Source', 'credibility_score': 9.0}])
+        
+        inline = crew.execute_research("What is AI?")
+        crew.clear_query_cache()
+        crew.config['overlap_postprocessing'] = True
+        overlapped = crew.execute_research("What is AI?")
+        crew.close()
+        
+        assert overlapped['sources'] == inline['sources']
+        assert overlapped['report'] == inline['report'] == {'executive_summary': 'AI is useful.'}
+        assert overlapped['metadata']['avg_credibility'] == 9.0
+    
     @patch('backend.features.orchestration.research_crew.Crew')
     def test_execute_research_failure(self, mock_crew_class, crew):
         """Test research execution with error"""
@@ -128,6 +259,64 @@ class TestResearchCrew:
         assert 'error' in result
         assert result['error'] == "Test error"
         assert 'execution_time' in result
+        
+        assert result['report'] == {}
+        assert result['sources'] == []
+        assert result['metadata']['total_sources'] == 0
+    
+    def test_parse_crew_result(self, crew):
+        """Test parsing markdown sections out of a crew result"""
+        result_text = (
+            "# Research Report\n"
+            "## Executive Summary\nAI is growing.\n\n\nFast.\n"
+            "## Introduction and Background\nContext here.\n"
+            "## Key Findings\n- Finding one\n"
+            "## Actionable Recommendations\nInvest.\n"
+            "## References\n[1] Source"
+        )
+        
+        report = crew._parse_crew_result(result_text)
+        
+        assert report == {
+            'executive_summary': "AI is growing.\nFast.",
+            'introduction': "Context here.",
+            'findings': "- Finding one",
+            'recommendations': "Invest.",
+            'references': "[1] Source"
+        }
+        
+        # Subheadings stay in their section and empty sections are dropped
+        report = crew._parse_crew_result(
+            "## Analysis\n### References\nCited inline.\n## Conclusions\n## Methodology\nSurvey."
+        )
+        assert report == {'analysis': "### References\nCited inline.", 'methodology': "Survey."}
+        
+        # Unstructured results fall back to the raw text
+        report = crew._parse_crew_result("Plain answer")
+        assert report == {'executive_summary': "Plain answer", 'full_content': "Plain answer"}
+        
+        # Crew outputs use their structured sections when present, else their raw text
+        report = crew._parse_crew_result(CrewOutput(raw="## Methodology\nSurvey."))
+        assert report == {'methodology': "Survey."}
+        report = crew._parse_crew_result(
+            CrewOutput(raw="{}", json_dict={'conclusions': "Done.", 'extra': 1, 'references': []})
+        )
+        assert report == {'conclusions': "Done."}
+    
+    def test_extract_sources_bad_scores(self, crew):
+        """Test that unusable credibility scores fall back to the default per source"""
+        crew.memory.share_data('information_gatherer', [
+            {'title': 'Scored', 'credibility_score': 9.0},
+            {'title': 'Missing', 'credibility_score': None},
+            {'title': 'Text', 'credibility_score': 'high'},
+            {'title': 'Numeric text', 'credibility_score': '8'}
+        ])
+        
+        table = crew._extract_sources()
+        
+        assert [s['title'] for s in table.records] == ['Scored', 'Missing', 'Text', 'Numeric text']
+        assert [s['credibility_score'] for s in table.records] == [9.0, 7.5, 7.5, 8.0]
+        assert table.avg_credibility() == 8.0
     
     def test_memory_operations(self, crew):
         """Test memory operations"""
@@ -206,6 +395,23 @@ class TestResearchCrew:
         call_args = mock_crew_class.call_args[1]
         assert 'embedder' in call_args
         assert call_args['embedder']['provider'] == 'openai'
+    
+    def test_embedding_cache(self):
+        """Test repeated texts are embedded only once"""
+        from backend.features.orchestration import embeddings
+        
+        embeddings.clear_embedding_cache()
+        with patch.object(embeddings.OpenAIEmbeddingFunction, '__call__',
+                          side_effect=lambda texts: [[float(len(t))] for t in texts]) as mock_embed:
+            embed = embeddings.CachedOpenAIEmbeddingFunction(api_key='sk-test', model_name='text-embedding-3-small')
+            
+            assert embed(['alpha', 'beta']) == [[5.0], [4.0]]
+            assert embed(['beta', 'gamma', 'alpha']) == [[4.0], [5.0], [5.0]]
+            
+            # Only the unseen text went to the API on the second call
+            assert mock_embed.call_count == 2
+            assert mock_embed.call_args[0][0] == ['gamma']
+        embeddings.clear_embedding_cache()
 
 
 if __name__ == "__main__":
@@ -14,7 +14,7 @@ load_dotenv()
 # Add the backend directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from backend.features.agents.synthesizer import ContentSynthesizerAgent
+from backend.features.agents.synthesizer import ContentSynthesizerAgent, SUMMARY_SECTIONS
 from backend.features.memory.research_memory import ResearchMemory
 
 
@@ -98,6 +98,15 @@ class TestContentSynthesizerAgent:
         agent = synthesizer.get_agent()
         assert agent.role == "Content Synthesizer"
     
+    def test_agent_created_lazily(self, synthesizer, sample_gathered_info, sample_analysis_results):
+        """Test that report synthesis never builds the CrewAI agent"""
+        synthesizer.synthesize_report("AI in healthcare", sample_gathered_info, sample_analysis_results)
+        assert 'agent' not in synthesizer.__dict__
+        assert 'tools' not in synthesizer.__dict__
+        
+        agent = synthesizer.get_agent()
+        assert synthesizer.get_agent() is agent
+    
     def test_synthesize_report(self, synthesizer, sample_gathered_info, sample_analysis_results):
         """Test report synthesis"""
         query = "What is the impact of AI on healthcare?"
@@ -134,6 +143,71 @@ class TestContentSynthesizerAgent:
         # Check memory
         stored = synthesizer.memory.get_short_term('completed_report')
         assert stored == report
+        shared = synthesizer.memory.get_shared_data('content_synthesizer')
+        assert shared['word_count'] == synthesizer._estimate_word_count(report)
+    
+    def test_parallel_sections(self, memory, synthesizer, sample_gathered_info, sample_analysis_results):
+        """Test that parallel section building produces the same report"""
+        query = "What is the impact of AI on healthcare?"
+        parallel = ContentSynthesizerAgent(memory, {'parallel_sections': True, 'max_workers': 4})
+        
+        try:
+            report = parallel.synthesize_report(query, sample_gathered_info, sample_analysis_results)
+        finally:
+            parallel.close()
+        expected = synthesizer.synthesize_report(query, sample_gathered_info, sample_analysis_results)
+        
+        report.pop('metadata')
+        expected.pop('metadata')
+        assert report == expected
+        assert parallel._section_pool is None
+        
+        # Nothing to build needs no pool
+        assert parallel._build_sections([]) == {}
+        assert parallel._section_pool is None
+    
+    def test_report_cache(self, synthesizer, sample_gathered_info, sample_analysis_results):
+        """Test that repeated inputs reuse the cached sections"""
+        query = "What is the impact of AI on healthcare?"
+        first = synthesizer.synthesize_report(query, sample_gathered_info, sample_analysis_results)
+        
+        with patch.object(synthesizer, '_create_executive_summary') as summary:
+            second = synthesizer.synthesize_report(query, sample_gathered_info, sample_analysis_results)
+            summary.assert_not_called()
+        assert second is not first
+        assert second['executive_summary'] == first['executive_summary']
+        assert synthesizer.memory.get_short_term('completed_report') is second
+        
+        # Changed inputs miss the cache
+        sample_analysis_results['confidence_levels']['overall'] = 0.3
+        third = synthesizer.synthesize_report(query, sample_gathered_info, sample_analysis_results)
+        assert third['executive_summary'] != first['executive_summary']
+        
+        synthesizer.clear_cache()
+        assert len(synthesizer._report_cache) == 0
+    
+    def test_synthesize_selected_sections(self, synthesizer, sample_gathered_info, sample_analysis_results):
+        """Test building only the sections a summary needs"""
+        query = "What is the impact of AI on healthcare?"
+        
+        with patch.object(synthesizer, '_compile_references') as references:
+            report = synthesizer.synthesize_report(
+                query, sample_gathered_info, sample_analysis_results, sections=SUMMARY_SECTIONS
+            )
+            references.assert_not_called()
+        
+        assert report['references'] == []
+        assert report['methodology'] == ''
+        assert len(report['executive_summary']) > 0
+        assert synthesizer.create_summary(report).startswith('Research Report:')
+        
+        full = synthesizer.synthesize_report(query, sample_gathered_info, sample_analysis_results)
+        assert list(full) == list(report)
+        assert full['conclusions'] == report['conclusions']
+        assert len(full['references']) == 2
+        
+        with pytest.raises(ValueError):
+            synthesizer.synthesize_report(query, sample_gathered_info, sample_analysis_results, sections=['appendix'])
     
     def test_generate_title(self, synthesizer):
         """Test title generation"""
@@ -164,6 +238,22 @@ class TestContentSynthesizerAgent:
         assert "2 key findings" in summary
         assert "high reliability" in summary.lower()
     
+    def test_create_introduction(self, synthesizer):
+        """Test source types in the introduction"""
+        gathered_info = {
+            'sources_used': [
+                {'url': 'https://med.edu/study'},
+                {'url': 'https://www.education.com/article'}
+            ]
+        }
+        
+        intro = synthesizer._create_introduction("AI in healthcare", gathered_info)
+        
+        assert "AI in healthcare" in intro
+        assert "academic" in intro
+        assert "general" in intro
+        assert "government" not in intro
+    
     def test_create_methodology(self, synthesizer, sample_gathered_info):
         """Test methodology section creation"""
         methodology = synthesizer._create_methodology(sample_gathered_info)
@@ -342,6 +432,11 @@ class TestContentSynthesizerAgent:
         shared = synthesizer.memory.get_shared_data('content_synthesizer')
         assert shared['status'] == 'completed'
         assert shared['report_type'] == 'research'
+        
+        # Buffered events are flushed with the completed report
+        synthesizer._agent_callback({'type': 'progress'})
+        history = synthesizer.memory.get_short_term('synthesizer_event_history')
+        assert history == [event, section_event, complete_event]
 
 
 if __name__ == "__main__":
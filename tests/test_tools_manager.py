@@ -219,13 +219,28 @@ class TestToolsManager:
         manager = ToolsManager()
         
         # Reload a tool that doesn't require API keys
+        original = manager.get_tool('file_read')
         success = manager.reload_tool('file_read')
         assert success is True
+        assert manager.get_tool('file_read') is not original
         
         # Try to reload non-existing tool
         success = manager.reload_tool('non_existent')
         assert success is False
     
+    def test_managers_share_built_tools(self, mock_env):
+        """Test that tools built with the same arguments are reused"""
+        first = ToolsManager({'serper': {'n_results': 5}})
+        second = ToolsManager({'serper': {'n_results': 5}})
+        third = ToolsManager({'serper': {'n_results': 7}})
+        
+        assert first.get_tool('file_read') is second.get_tool('file_read')
+        assert first.get_tool('serper') is second.get_tool('serper')
+        assert first.get_tool('serper') is not third.get_tool('serper')
+        
+        reset_tools_manager()
+        assert ToolsManager().get_tool('file_read') is not first.get_tool('file_read')
+    
     def test_singleton_behavior(self, mock_env):
         """Test singleton pattern"""
         manager1 = get_tools_manager()